@@ -2,11 +2,21 @@
 Agent 2: Checker
 Handles automated answer evaluation and scoring
 """
+import heapq
+from operator import itemgetter
 from crewai import Agent, Task
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Union
+import numpy as np
 import pandas as pd
 from tools.sheets_manager import SheetsManager
-from config import Config
+from tools.scoring import INVALID_ANSWER, UNANSWERED, QuizAnswerKey, answer_matrix
+from tools.scoring_kernels import NUMBA_AVAILABLE, score_matrix
+
+# Header row of the Quiz_Results sheet
+QUIZ_RESULTS_HEADERS = [
+    'Student_ID', 'Student_Name', 'Total_Score', 'Max_Possible',
+    'Percentage', 'Correct_Answers', 'Total_Questions', 'Timestamp'
+]
 
 class CheckerAgent:
     def __init__(self, sheets_manager: SheetsManager):
@@ -54,69 +64,84 @@ class CheckerAgent:
         )
     
     def evaluate_answers(self, student_answers: List[Dict[str, Any]], 
-                        quiz_questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                        quiz_questions: Union[List[Dict[str, Any]], QuizAnswerKey],
+                        detail: bool = False) -> Union[List[Dict[str, Any]],
+                                                       Tuple[List[Dict[str, Any]], pd.DataFrame]]:
         """
         Evaluate student answers against the answer key
         
         Args:
             student_answers: List of student answer dictionaries
-            quiz_questions: List of quiz questions with correct answers
+            quiz_questions: List of quiz questions with correct answers, or a
+                prebuilt QuizAnswerKey
+            detail: Also return the per-question breakdown
         
         Returns:
-            List of evaluation results
+            List of evaluation results; with detail=True, a tuple of the results
+            and a DataFrame with one row per answered question
         """
-        results = []
-        
-        for student in student_answers:
-            student_id = student.get('student_id', 'Unknown')
-            student_name = student.get('name', 'Unknown')
-            answers = student.get('answers', [])
-            
-            total_score = 0
-            max_possible = 0
-            correct_answers = 0
-            
-            evaluation_details = []
-            
-            for i, answer in enumerate(answers):
-                if i < len(quiz_questions):
-                    question = quiz_questions[i]
-                    correct_answer = question['correct_answer']
-                    points = question['points']
-                    
-                    max_possible += points
-                    
-                    is_correct = (answer == correct_answer)
-                    if is_correct:
-                        total_score += points
-                        correct_answers += 1
-                    
-                    evaluation_details.append({
-                        'question_index': i,
-                        'student_answer': answer,
-                        'correct_answer': correct_answer,
-                        'is_correct': is_correct,
-                        'points_earned': points if is_correct else 0,
-                        'max_points': points
-                    })
-            
-            percentage = (total_score / max_possible * 100) if max_possible > 0 else 0
-            
-            result = {
+        if not isinstance(quiz_questions, QuizAnswerKey):
+            quiz_questions = QuizAnswerKey.from_questions(quiz_questions)
+        n_questions = len(quiz_questions)
+        correct, points = quiz_questions.correct, quiz_questions.points
+        answers = answer_matrix(student_answers, n_questions)
+        
+        # Score every student against the key in one pass over the [S, Q] matrix;
+        # only the totals are computed here, no per-question points matrix
+        if NUMBA_AVAILABLE:
+            total_scores, correct_counts, max_possible = score_matrix(
+                answers, correct, points.astype(np.float64))
+            total_scores = total_scores.astype(points.dtype)
+            max_possible = max_possible.astype(points.dtype)
+        else:
+            correct_mask = answers == correct
+            total_scores = correct_mask @ points
+            max_possible = (answers != UNANSWERED) @ points
+            correct_counts = correct_mask.sum(axis=1)
+        percentages = np.divide(total_scores * 100, max_possible,
+                                out=np.zeros(len(student_answers)), where=max_possible > 0)
+        
+        student_ids = [student.get('student_id', 'Unknown') for student in student_answers]
+        timestamp = pd.Timestamp.now().isoformat()
+        
+        results = [
+            {
                 'student_id': student_id,
-                'student_name': student_name,
-                'total_score': total_score,
-                'max_possible': max_possible,
-                'percentage': round(percentage, 2),
-                'correct_answers': correct_answers,
-                'total_questions': len(quiz_questions),
-                'evaluation_details': evaluation_details,
-                'timestamp': pd.Timestamp.now().isoformat()
+                'student_name': student.get('name', 'Unknown'),
+                'total_score': total_scores[i].item(),
+                'max_possible': max_possible[i].item(),
+                'percentage': round(float(percentages[i]), 2),
+                'correct_answers': int(correct_counts[i]),
+                'total_questions': n_questions,
+                'timestamp': timestamp
             }
-            
-            results.append(result)
+            for i, (student_id, student) in enumerate(zip(student_ids, student_answers))
+        ]
+        
+        if not detail:
+            return results
         
-        return results
+        # Columnar breakdown gathered straight from the score matrices; student IDs
+        # are stored as category codes instead of one string object per row
+        correct_mask = answers == correct
+        earned = correct_mask * points
+        rows, cols = np.nonzero(answers != UNANSWERED)
+        given = answers[rows, cols]
+        if (given == INVALID_ANSWER).any():
+            # Report invalid answers as submitted rather than by their matrix code
+            given = given.astype(object)
+            for j in np.flatnonzero(given == INVALID_ANSWER):
+                given[j] = student_answers[rows[j]]['answers'][cols[j]]
+        id_codes, unique_ids = pd.factorize(pd.Series(student_ids, dtype=object))
+        details = pd.DataFrame({
+            'student_id': pd.Categorical.from_codes(id_codes[rows], categories=unique_ids),
+            'question_index': cols,
+            'student_answer': given,
+            'correct_answer': correct[cols],
+            'is_correct': correct_mask[rows, cols],
+            'points_earned': earned[rows, cols]
+        })
+        return results, details
     
     def store_evaluation_results(self, results: List[Dict[str, Any]]) -> bool:
         """
@@ -130,10 +155,7 @@ class CheckerAgent:
         """
         try:
             # Prepare data for Google Sheets
-            headers = ['Student_ID', 'Student_Name', 'Total_Score', 'Max_Possible', 
-                      'Percentage', 'Correct_Answers', 'Total_Questions', 'Timestamp']
-            
-            rows = [headers]
+            rows = [QUIZ_RESULTS_HEADERS]
             
             for result in results:
                 row = [
@@ -209,10 +231,8 @@ class CheckerAgent:
         if not results:
             return []
         
-        # Sort by percentage (descending)
-        sorted_results = sorted(results, key=lambda x: x['percentage'], reverse=True)
-        
-        return sorted_results[:limit]
+        # Partial sort: keep only the top `limit` by percentage (descending)
+        return heapq.nlargest(limit, results, key=itemgetter('percentage'))
     
     def initialize_results_sheet(self) -> bool:
         """
@@ -222,9 +242,7 @@ class CheckerAgent:
             True if successful
         """
         try:
-            headers = [['Student_ID', 'Student_Name', 'Total_Score', 'Max_Possible', 
-                       'Percentage', 'Correct_Answers', 'Total_Questions', 'Timestamp']]
-            self.sheets_manager.write_sheet('Quiz_Results', headers)
+            self.sheets_manager.write_sheet('Quiz_Results', [QUIZ_RESULTS_HEADERS])
             print("Quiz results sheet initialized successfully")
             return True
         except Exception as e:
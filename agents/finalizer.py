@@ -2,12 +2,36 @@
 Agent 5: Finalizer
 Handles final top 5 selection based on video analysis
 """
+from collections import Counter
+from concurrent.futures import as_completed
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from crewai import Agent, Task
 from typing import List, Dict, Any
-import pandas as pd
-from tools.sheets_manager import SheetsManager
+import numpy as np
+from tools.sheets_manager import SheetsManager, pad_row, to_float, TRUE_VALUES
 from tools.email_manager import EmailManager
-from config import Config
+from tools.scoring_kernels import NUMBA_AVAILABLE, EDUCATION_BONUS, EDUCATION_CODES, score_top_k
+from config import get_config
+
+# Header row of the Final_Selection sheet
+FINAL_SELECTION_HEADERS = [
+    'Student_ID', 'Email', 'Confidence_Score', 'AI_Experience_Score',
+    'Education_Status', 'Communication_Score', 'Comprehensive_Score', 'Education_Bonus',
+    'Final_Selection_Status', 'Final_Email_Sent', 'Final_Email_Timestamp', 'Final_Selection_Timestamp'
+]
+
+# Extracts one Final_Selection row from a candidate, in header order
+_final_selection_row = itemgetter(
+    'student_id', 'email', 'confidence_score', 'ai_experience_score',
+    'education_status', 'communication_score', 'comprehensive_score', 'education_bonus',
+    'final_selection_status', 'final_email_sent', 'final_email_timestamp', 'final_selection_timestamp'
+)
+_FINAL_SELECTION_ROW_DEFAULTS = {'email': '', 'final_email_timestamp': ''}
+
+# Video analysis columns the comprehensive score is built from
+SCORE_COLUMNS = ['confidence_score', 'ai_experience_score', 'communication_score', 'education_status']
 
 class FinalizerAgent:
     def __init__(self, sheets_manager: SheetsManager, email_manager: EmailManager):
@@ -21,6 +45,9 @@ class FinalizerAgent:
         self.sheets_manager = sheets_manager
         self.email_manager = email_manager
         self.agent = self._create_agent()
+        # Last raw Final_Selection rows and their parsed form; the sheets manager hands back
+        # the same rows object until its cached read expires or the sheet is written
+        self._parsed_cache = None
     
     def _create_agent(self) -> Agent:
         """Create the CrewAI agent"""
@@ -47,7 +74,7 @@ class FinalizerAgent:
         """
         return Task(
             description=f"""
-            Select the final top {Config.MAX_FINAL_SELECTION} students from {len(video_analysis_results)} 
+            Select the final top {get_config().MAX_FINAL_SELECTION} students from {len(video_analysis_results)} 
             video interview candidates. Consider:
             - Confidence and communication skills
             - AI/ML experience and technical knowledge
@@ -83,40 +110,43 @@ class FinalizerAgent:
         
         # Apply limit
         if limit is None:
-            limit = Config.MAX_FINAL_SELECTION
+            limit = get_config().MAX_FINAL_SELECTION
+        
+        # Imported here so loading the agent does not pull in pandas
+        import pandas as pd
+        df = pd.DataFrame(successful_results, columns=SCORE_COLUMNS)
+        
+        # Calculate comprehensive score for all candidates in one vectorized pass
+        confidence = df['confidence_score'].to_numpy(np.float64)
+        ai_experience = df['ai_experience_score'].to_numpy(np.float64)
+        communication = df['communication_score'].to_numpy(np.float64)
+        education = df['education_status'].map(EDUCATION_CODES).fillna(0).to_numpy(np.int8)
+        
+        # Education bonus
+        education_bonus = EDUCATION_BONUS[education]
         
-        # Calculate comprehensive score for each candidate
-        for result in successful_results:
+        # Final comprehensive score; the compiled kernel scores and picks the top in one pass
+        if NUMBA_AVAILABLE:
+            scores, top = score_top_k(confidence, ai_experience, communication,
+                                      education, EDUCATION_BONUS, limit)
+        else:
             # Base score from video analysis
-            base_score = (
-                result['confidence_score'] * 0.25 +
-                result['ai_experience_score'] * 0.35 +
-                result['communication_score'] * 0.25
-            )
-            
-            # Education bonus
-            education_bonus = 0
-            if result['education_status'] == 'graduated':
-                education_bonus = 1.5
-            elif result['education_status'] == 'final year':
-                education_bonus = 1.0
-            
-            # Final comprehensive score
-            result['comprehensive_score'] = base_score + education_bonus
-            result['education_bonus'] = education_bonus
+            df['comprehensive_score'] = confidence * 0.25 + ai_experience * 0.35 + communication * 0.25 + education_bonus
+            scores = df['comprehensive_score'].to_numpy()
+            top = df.nlargest(limit, 'comprehensive_score').index
         
-        # Sort by comprehensive score (descending)
-        sorted_results = sorted(successful_results, 
-                              key=lambda x: x['comprehensive_score'], 
-                              reverse=True)
+        for result, score, bonus in zip(successful_results, scores.tolist(), education_bonus.tolist()):
+            result['comprehensive_score'] = score
+            result['education_bonus'] = bonus
         
-        # Select top candidates
-        final_candidates = sorted_results[:limit]
+        # Select top candidates by comprehensive score (descending) without a full sort
+        final_candidates = [successful_results[i] for i in top]
         
         # Add final selection metadata
+        timestamp = datetime.now().isoformat()
         for candidate in final_candidates:
             candidate['final_selection_status'] = 'selected'
-            candidate['final_selection_timestamp'] = pd.Timestamp.now().isoformat()
+            candidate['final_selection_timestamp'] = timestamp
             candidate['final_email_sent'] = False
         
         return final_candidates
@@ -132,6 +162,7 @@ class FinalizerAgent:
             Dict mapping student emails to success status
         """
         results = {}
+        pending = {}
         
         for candidate in final_candidates:
             # Extract email from candidate data
@@ -142,14 +173,19 @@ class FinalizerAgent:
                 results[email] = False
                 continue
             
-            # Send final selection email
-            success = self.email_manager.send_final_selection_notification(email)
-            
+            # Queue final selection email; the pool sends them concurrently
+            future = self.email_manager.enqueue_final_selection_notification(email)
+            pending[future] = (candidate, email)
+        
+        # Record each outcome as soon as its send finishes
+        for future in as_completed(pending):
+            candidate, email = pending[future]
+            success = future.result()
             results[email] = success
             
             # Update candidate record
             candidate['final_email_sent'] = success
-            candidate['final_email_timestamp'] = pd.Timestamp.now().isoformat() if success else None
+            candidate['final_email_timestamp'] = datetime.now().isoformat() if success else None
         
         return results
     
@@ -165,34 +201,17 @@ class FinalizerAgent:
         """
         try:
             # Prepare data for Google Sheets
-            headers = ['Student_ID', 'Email', 'Confidence_Score', 'AI_Experience_Score', 
-                      'Education_Status', 'Communication_Score', 'Comprehensive_Score',
-                      'Education_Bonus', 'Final_Selection_Status', 'Final_Email_Sent',
-                      'Final_Email_Timestamp', 'Final_Selection_Timestamp']
-            
-            rows = [headers]
-            
-            for candidate in final_candidates:
-                row = [
-                    candidate['student_id'],
-                    candidate.get('email', ''),
-                    candidate['confidence_score'],
-                    candidate['ai_experience_score'],
-                    candidate['education_status'],
-                    candidate['communication_score'],
-                    candidate['comprehensive_score'],
-                    candidate['education_bonus'],
-                    candidate['final_selection_status'],
-                    candidate['final_email_sent'],
-                    candidate.get('final_email_timestamp', ''),
-                    candidate['final_selection_timestamp']
-                ]
-                rows.append(row)
+            rows = (
+                list(_final_selection_row(_FINAL_SELECTION_ROW_DEFAULTS | candidate))
+                for candidate in final_candidates
+            )
             
-            # Write to Google Sheets
-            self.sheets_manager.write_sheet('Final_Selection', rows)
+            # Write to Google Sheets in chunks; the header rides in the first chunk
+            written = self.sheets_manager.write_rows_chunked(
+                'Final_Selection', chain([FINAL_SELECTION_HEADERS], rows), start_row=1
+            )
             
-            print(f"Successfully stored {len(final_candidates)} final selection results")
+            print(f"Successfully stored {written - 1} final selection results")
             return True
             
         except Exception as e:
@@ -207,33 +226,41 @@ class FinalizerAgent:
             List of final selection results
         """
         try:
-            data = self.sheets_manager.read_sheet('Final_Selection')
+            # Read-only rows; their identity tells whether the parsed form is current
+            data = self.sheets_manager.read_sheet('Final_Selection', copy=False)
             
             if not data:
                 return []
             
-            headers = data[0]
+            if self._parsed_cache is not None and self._parsed_cache[0] is data:
+                return [dict(result) for result in self._parsed_cache[1]]
+            
+            width = len(FINAL_SELECTION_HEADERS)
             results = []
             
             for row in data[1:]:
-                if len(row) >= len(headers):
-                    result = {
-                        'student_id': row[0],
-                        'email': row[1],
-                        'confidence_score': float(row[2]) if row[2] else 0,
-                        'ai_experience_score': float(row[3]) if row[3] else 0,
-                        'education_status': row[4],
-                        'communication_score': float(row[5]) if row[5] else 0,
-                        'comprehensive_score': float(row[6]) if row[6] else 0,
-                        'education_bonus': float(row[7]) if row[7] else 0,
-                        'final_selection_status': row[8],
-                        'final_email_sent': row[9].lower() == 'true' if row[9] else False,
-                        'final_email_timestamp': row[10],
-                        'final_selection_timestamp': row[11]
-                    }
-                    results.append(result)
+                # Blank sheet rows are not candidates
+                if not any(row):
+                    continue
+                row = pad_row(row, width)
+                result = {
+                    'student_id': row[0],
+                    'email': row[1],
+                    'confidence_score': to_float(row[2]),
+                    'ai_experience_score': to_float(row[3]),
+                    'education_status': row[4],
+                    'communication_score': to_float(row[5]),
+                    'comprehensive_score': to_float(row[6]),
+                    'education_bonus': to_float(row[7]),
+                    'final_selection_status': row[8],
+                    'final_email_sent': row[9] in TRUE_VALUES,
+                    'final_email_timestamp': row[10],
+                    'final_selection_timestamp': row[11]
+                }
+                results.append(result)
             
-            return results
+            self._parsed_cache = (data, results)
+            return [dict(result) for result in results]
             
         except Exception as e:
             print(f"Error retrieving final selection results: {e}")
@@ -252,17 +279,20 @@ class FinalizerAgent:
         if not final_candidates:
             return "No candidates selected."
         
-        report = f"""
+        parts = [f"""
 FINAL SELECTION REPORT
 =====================
 
 Total Candidates Selected: {len(final_candidates)}
 
 SELECTED CANDIDATES:
-"""
+"""]
         
+        # One pass collects the candidate blocks, score totals and education counts
+        total_confidence = total_ai_experience = total_communication = 0.0
+        education_counts = Counter()
         for i, candidate in enumerate(final_candidates, 1):
-            report += f"""
+            parts.append(f"""
 {i}. Student ID: {candidate['student_id']}
    Email: {candidate.get('email', 'N/A')}
    Confidence Score: {candidate['confidence_score']}/10
@@ -272,32 +302,27 @@ SELECTED CANDIDATES:
    Comprehensive Score: {candidate['comprehensive_score']:.2f}
    Education Bonus: {candidate['education_bonus']}
    Final Email Sent: {candidate['final_email_sent']}
-"""
+""")
+            total_confidence += candidate['confidence_score']
+            total_ai_experience += candidate['ai_experience_score']
+            total_communication += candidate['communication_score']
+            education_counts[candidate['education_status']] += 1
         
         # Calculate statistics
-        avg_confidence = sum(c['confidence_score'] for c in final_candidates) / len(final_candidates)
-        avg_ai_experience = sum(c['ai_experience_score'] for c in final_candidates) / len(final_candidates)
-        avg_communication = sum(c['communication_score'] for c in final_candidates) / len(final_candidates)
-        
-        report += f"""
+        n = len(final_candidates)
+        parts.append(f"""
 
 STATISTICS:
-- Average Confidence Score: {avg_confidence:.2f}/10
-- Average AI Experience Score: {avg_ai_experience:.2f}/10
-- Average Communication Score: {avg_communication:.2f}/10
+- Average Confidence Score: {total_confidence / n:.2f}/10
+- Average AI Experience Score: {total_ai_experience / n:.2f}/10
+- Average Communication Score: {total_communication / n:.2f}/10
 
 Education Distribution:
-"""
-        
-        education_counts = {}
-        for candidate in final_candidates:
-            status = candidate['education_status']
-            education_counts[status] = education_counts.get(status, 0) + 1
+""")
         
-        for status, count in education_counts.items():
-            report += f"- {status.title()}: {count} candidates\n"
+        parts.extend(f"- {status.title()}: {count} candidates\n" for status, count in education_counts.items())
         
-        return report
+        return ''.join(parts)
     
     def initialize_final_selection_sheet(self) -> bool:
         """
@@ -307,11 +332,7 @@ Education Distribution:
             True if successful
         """
         try:
-            headers = [['Student_ID', 'Email', 'Confidence_Score', 'AI_Experience_Score', 
-                       'Education_Status', 'Communication_Score', 'Comprehensive_Score',
-                       'Education_Bonus', 'Final_Selection_Status', 'Final_Email_Sent',
-                       'Final_Email_Timestamp', 'Final_Selection_Timestamp']]
-            self.sheets_manager.write_sheet('Final_Selection', headers)
+            self.sheets_manager.write_sheet('Final_Selection', [FINAL_SELECTION_HEADERS])
             print("Final selection sheet initialized successfully")
             return True
         except Exception as e:
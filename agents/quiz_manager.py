@@ -2,11 +2,25 @@
 Agent 1: Quiz Manager
 Handles admin-controlled quiz creation and management
 """
+import json
+import os
+from operator import itemgetter
 from crewai import Agent, Task
 from typing import List, Dict, Any
-import pandas as pd
-from tools.sheets_manager import SheetsManager
-from config import Config
+from tools.sheets_manager import SheetsManager, pad_row, to_int
+
+# Header row of the Quiz_Questions sheet
+QUIZ_QUESTION_HEADERS = [
+    'Question', 'Option_A', 'Option_B', 'Option_C',
+    'Option_D', 'Correct_Answer', 'Points', 'Category'
+]
+
+# Sample quiz shipped with the project under data/
+SAMPLE_QUIZ_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'data', 'sample_quiz.json')
+
+# Extracts the answer key fields that follow the options in a Quiz_Questions row
+_answer_fields = itemgetter('correct_answer', 'points', 'category')
 
 class QuizManagerAgent:
     def __init__(self, sheets_manager: SheetsManager):
@@ -18,6 +32,9 @@ class QuizManagerAgent:
         """
         self.sheets_manager = sheets_manager
         self.agent = self._create_agent()
+        # Last raw Quiz_Questions rows and their parsed form; the sheets manager hands back
+        # the same rows object until its cached read expires or the sheet is written
+        self._parsed_cache = None
     
     def _create_agent(self) -> Agent:
         """Create the CrewAI agent"""
@@ -71,23 +88,14 @@ class QuizManagerAgent:
         """
         try:
             # Prepare data for Google Sheets
-            headers = ['Question', 'Option_A', 'Option_B', 'Option_C', 'Option_D', 
-                      'Correct_Answer', 'Points', 'Category']
-            
-            rows = [headers]
-            
-            for i, question in enumerate(questions_data, 1):
-                row = [
+            rows = [QUIZ_QUESTION_HEADERS] + [
+                [
                     question['question'],
-                    question['options'][0] if len(question['options']) > 0 else '',
-                    question['options'][1] if len(question['options']) > 1 else '',
-                    question['options'][2] if len(question['options']) > 2 else '',
-                    question['options'][3] if len(question['options']) > 3 else '',
-                    question['correct_answer'],
-                    question['points'],
-                    question['category']
+                    *(list(question['options'][:4]) + [''] * 4)[:4],
+                    *_answer_fields(question)
                 ]
-                rows.append(row)
+                for question in questions_data
+            ]
             
             # Write to Google Sheets
             self.sheets_manager.write_sheet('Quiz_Questions', rows)
@@ -107,26 +115,35 @@ class QuizManagerAgent:
             List of question dictionaries
         """
         try:
-            data = self.sheets_manager.read_sheet('Quiz_Questions')
+            # Read-only rows; their identity tells whether the parsed form is current
+            data = self.sheets_manager.read_sheet('Quiz_Questions', copy=False)
             
             if not data:
                 return []
             
-            headers = data[0]
+            if self._parsed_cache is not None and self._parsed_cache[0] is data:
+                return [{**question, 'options': list(question['options'])} for question in self._parsed_cache[1]]
+            
+            width = len(QUIZ_QUESTION_HEADERS)
             questions = []
             
             for row in data[1:]:
-                if len(row) >= len(headers):
-                    question = {
-                        'question': row[0],
-                        'options': [row[1], row[2], row[3], row[4]],
-                        'correct_answer': int(row[5]) if row[5].isdigit() else 0,
-                        'points': int(row[6]) if row[6].isdigit() else 1,
-                        'category': row[7]
-                    }
-                    questions.append(question)
+                # Blank rows between questions are not questions; padding them would
+                # add 1-point entries to the quiz
+                if not row or not str(row[0]).strip():
+                    continue
+                row = pad_row(row, width)
+                question = {
+                    'question': row[0],
+                    'options': [row[1], row[2], row[3], row[4]],
+                    'correct_answer': to_int(row[5]),
+                    'points': to_int(row[6], 1),
+                    'category': row[7]
+                }
+                questions.append(question)
             
-            return questions
+            self._parsed_cache = (data, questions)
+            return [{**question, 'options': list(question['options'])} for question in questions]
             
         except Exception as e:
             print(f"Error retrieving quiz questions: {e}")
@@ -139,46 +156,9 @@ class QuizManagerAgent:
         Returns:
             List of sample questions
         """
-        sample_questions = [
-            {
-                'question': 'What is machine learning?',
-                'options': [
-                    'A computer program that learns from data',
-                    'A type of database',
-                    'A programming language',
-                    'A hardware component'
-                ],
-                'correct_answer': 0,
-                'points': 2,
-                'category': 'AI/ML Basics'
-            },
-            {
-                'question': 'Which algorithm is commonly used for classification?',
-                'options': [
-                    'Linear Regression',
-                    'Random Forest',
-                    'K-means',
-                    'A* Search'
-                ],
-                'correct_answer': 1,
-                'points': 2,
-                'category': 'Algorithms'
-            },
-            {
-                'question': 'What is the purpose of cross-validation?',
-                'options': [
-                    'To increase model complexity',
-                    'To evaluate model performance',
-                    'To reduce data size',
-                    'To speed up training'
-                ],
-                'correct_answer': 1,
-                'points': 3,
-                'category': 'Model Evaluation'
-            }
-        ]
-        
-        return sample_questions
+        # Parsed fresh on each call, so every caller gets its own mutable questions
+        with open(SAMPLE_QUIZ_FILE) as f:
+            return json.load(f)
     
     def initialize_quiz_sheet(self) -> bool:
         """
@@ -188,9 +168,7 @@ class QuizManagerAgent:
             True if successful
         """
         try:
-            headers = [['Question', 'Option_A', 'Option_B', 'Option_C', 'Option_D', 
-                       'Correct_Answer', 'Points', 'Category']]
-            self.sheets_manager.write_sheet('Quiz_Questions', headers)
+            self.sheets_manager.write_sheet('Quiz_Questions', [QUIZ_QUESTION_HEADERS])
             print("Quiz questions sheet initialized successfully")
             return True
         except Exception as e:
@@ -2,12 +2,30 @@
 Agent 3: Shortlist Agent
 Handles top 10 student selection and email notifications
 """
+import heapq
+from operator import itemgetter
+from concurrent.futures import as_completed
+from datetime import datetime
 from crewai import Agent, Task
 from typing import List, Dict, Any
-import pandas as pd
-from tools.sheets_manager import SheetsManager
+from tools.sheets_manager import SheetsManager, pad_row, to_float, TRUE_VALUES
 from tools.email_manager import EmailManager
-from config import Config
+from config import get_config
+
+# Header row of the Shortlist_Results sheet
+SHORTLIST_HEADERS = [
+    'Student_ID', 'Student_Name', 'Email', 'Quiz_Score',
+    'Percentage', 'Shortlist_Status', 'Email_Sent', 'Email_Timestamp',
+    'Video_Uploaded', 'Shortlist_Timestamp'
+]
+
+# Extracts one Shortlist_Results row from a student, in header order
+_shortlist_row = itemgetter(
+    'student_id', 'student_name', 'email', 'total_score',
+    'percentage', 'shortlist_status', 'email_sent', 'email_timestamp',
+    'video_uploaded', 'shortlist_timestamp'
+)
+_SHORTLIST_ROW_DEFAULTS = {'email': '', 'email_timestamp': ''}
 
 class ShortlistAgent:
     def __init__(self, sheets_manager: SheetsManager, email_manager: EmailManager):
@@ -21,6 +39,11 @@ class ShortlistAgent:
         self.sheets_manager = sheets_manager
         self.email_manager = email_manager
         self.agent = self._create_agent()
+        # Last raw Shortlist_Results rows and their parsed form; the sheets manager hands back
+        # the same rows object until its cached read expires or the sheet is written
+        self._parsed_cache = None
+        # Student ID -> Shortlist_Results sheet row, built from the last parsed read
+        self._row_index = None
     
     def _create_agent(self) -> Agent:
         """Create the CrewAI agent"""
@@ -71,19 +94,18 @@ class ShortlistAgent:
         if not quiz_results:
             return []
         
-        # Sort by percentage (descending)
-        sorted_results = sorted(quiz_results, key=lambda x: x['percentage'], reverse=True)
-        
         # Apply limit
         if limit is None:
-            limit = Config.MAX_SHORTLIST
+            limit = get_config().MAX_SHORTLIST
         
-        shortlisted = sorted_results[:limit]
+        # Select top students by percentage (descending) without a full sort
+        shortlisted = heapq.nlargest(limit, quiz_results, key=itemgetter('percentage'))
         
         # Add shortlist metadata
+        timestamp = datetime.now().isoformat()
         for student in shortlisted:
             student['shortlist_status'] = 'selected'
-            student['shortlist_timestamp'] = pd.Timestamp.now().isoformat()
+            student['shortlist_timestamp'] = timestamp
             student['email_sent'] = False
             student['video_uploaded'] = False
         
@@ -103,6 +125,7 @@ class ShortlistAgent:
             Dict mapping student emails to success status
         """
         results = {}
+        pending = {}
         
         for student in shortlisted_students:
             # Extract email from student data (assuming it's stored)
@@ -113,16 +136,21 @@ class ShortlistAgent:
                 results[email] = False
                 continue
             
-            # Send notification email
-            success = self.email_manager.send_shortlist_notification(
+            # Queue notification email; the pool sends them concurrently
+            future = self.email_manager.enqueue_shortlist_notification(
                 email, drive_link, deadline
             )
-            
+            pending[future] = (student, email)
+        
+        # Record each outcome as soon as its send finishes
+        for future in as_completed(pending):
+            student, email = pending[future]
+            success = future.result()
             results[email] = success
             
             # Update student record
             student['email_sent'] = success
-            student['email_timestamp'] = pd.Timestamp.now().isoformat() if success else None
+            student['email_timestamp'] = datetime.now().isoformat() if success else None
         
         return results
     
@@ -138,29 +166,14 @@ class ShortlistAgent:
         """
         try:
             # Prepare data for Google Sheets
-            headers = ['Student_ID', 'Student_Name', 'Email', 'Quiz_Score', 'Percentage',
-                      'Shortlist_Status', 'Email_Sent', 'Email_Timestamp', 
-                      'Video_Uploaded', 'Shortlist_Timestamp']
-            
-            rows = [headers]
-            
-            for student in shortlisted_students:
-                row = [
-                    student['student_id'],
-                    student['student_name'],
-                    student.get('email', ''),
-                    student['total_score'],
-                    student['percentage'],
-                    student['shortlist_status'],
-                    student['email_sent'],
-                    student.get('email_timestamp', ''),
-                    student['video_uploaded'],
-                    student['shortlist_timestamp']
-                ]
-                rows.append(row)
+            rows = [SHORTLIST_HEADERS] + [
+                list(_shortlist_row(_SHORTLIST_ROW_DEFAULTS | student))
+                for student in shortlisted_students
+            ]
             
             # Write to Google Sheets
             self.sheets_manager.write_sheet('Shortlist_Results', rows)
+            self._row_index = None
             
             print(f"Successfully stored {len(shortlisted_students)} shortlist results")
             return True
@@ -177,31 +190,42 @@ class ShortlistAgent:
             List of shortlist results
         """
         try:
-            data = self.sheets_manager.read_sheet('Shortlist_Results')
+            # Read-only rows; their identity tells whether the parsed form is current
+            data = self.sheets_manager.read_sheet('Shortlist_Results', copy=False)
             
             if not data:
                 return []
             
-            headers = data[0]
+            if self._parsed_cache is not None and self._parsed_cache[0] is data:
+                return [dict(result) for result in self._parsed_cache[1]]
+            
+            width = len(SHORTLIST_HEADERS)
             results = []
+            row_index = {}
             
-            for row in data[1:]:
-                if len(row) >= len(headers):
-                    result = {
-                        'student_id': row[0],
-                        'student_name': row[1],
-                        'email': row[2],
-                        'quiz_score': float(row[3]) if row[3] else 0,
-                        'percentage': float(row[4]) if row[4] else 0,
-                        'shortlist_status': row[5],
-                        'email_sent': row[6].lower() == 'true' if row[6] else False,
-                        'email_timestamp': row[7],
-                        'video_uploaded': row[8].lower() == 'true' if row[8] else False,
-                        'shortlist_timestamp': row[9]
-                    }
-                    results.append(result)
+            for row_number, row in enumerate(data[1:], start=2):
+                # Blank sheet rows are not students
+                if not any(row):
+                    continue
+                row = pad_row(row, width)
+                result = {
+                    'student_id': row[0],
+                    'student_name': row[1],
+                    'email': row[2],
+                    'quiz_score': to_float(row[3]),
+                    'percentage': to_float(row[4]),
+                    'shortlist_status': row[5],
+                    'email_sent': row[6] in TRUE_VALUES,
+                    'email_timestamp': row[7],
+                    'video_uploaded': row[8] in TRUE_VALUES,
+                    'shortlist_timestamp': row[9]
+                }
+                results.append(result)
+                row_index[result['student_id']] = row_number
             
-            return results
+            self._parsed_cache = (data, results)
+            self._row_index = row_index
+            return [dict(result) for result in results]
             
         except Exception as e:
             print(f"Error retrieving shortlist results: {e}")
@@ -219,8 +243,16 @@ class ShortlistAgent:
             True if successful
         """
         try:
-            # This would need to be implemented based on your specific sheet structure
-            # For now, we'll just return True as a placeholder
+            if self._row_index is None:
+                self.get_shortlist_results()
+            
+            row = (self._row_index or {}).get(student_id)
+            if row is None:
+                print(f"Student {student_id} not found in shortlist results")
+                return False
+            
+            # Patch only the Video_Uploaded cell of the student's row
+            self.sheets_manager.update_cell('Shortlist_Results', f'I{row}', video_uploaded)
             print(f"Updated video status for student {student_id}: {video_uploaded}")
             return True
         except Exception as e:
@@ -235,10 +267,7 @@ class ShortlistAgent:
             True if successful
         """
         try:
-            headers = [['Student_ID', 'Student_Name', 'Email', 'Quiz_Score', 'Percentage',
-                       'Shortlist_Status', 'Email_Sent', 'Email_Timestamp', 
-                       'Video_Uploaded', 'Shortlist_Timestamp']]
-            self.sheets_manager.write_sheet('Shortlist_Results', headers)
+            self.sheets_manager.write_sheet('Shortlist_Results', [SHORTLIST_HEADERS])
             print("Shortlist results sheet initialized successfully")
             return True
         except Exception as e:
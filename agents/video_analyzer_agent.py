@@ -2,12 +2,89 @@
 Agent 4: Video Analyzer Agent
 Handles video analysis and transcript processing
 """
+import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import repeat
 from crewai import Agent, Task
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
-from tools.sheets_manager import SheetsManager
+from tools.sheets_manager import SheetsManager, TRUE_VALUES
 from tools.video_analyzer import VideoAnalyzer
-from config import Config
+from tools.scoring import top_k_indices
+from tools import analysis_cache
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Header row of the Video_Analysis sheet
+VIDEO_ANALYSIS_HEADERS = [
+    'Student_ID', 'Video_Path', 'Transcript', 'Confidence_Score',
+    'AI_Experience_Score', 'Education_Status', 'Communication_Score', 'Detailed_Analysis',
+    'Analysis_Timestamp', 'Success'
+]
+
+# Result keys of the Video_Analysis columns, in header order
+VIDEO_ANALYSIS_COLUMNS = [header.lower() for header in VIDEO_ANALYSIS_HEADERS]
+VIDEO_SCORE_COLUMNS = ['confidence_score', 'ai_experience_score', 'communication_score']
+
+# Weights of the combined score used to rank video candidates
+COMBINED_SCORE_WEIGHTS = np.array([0.3, 0.4, 0.3])
+
+# Longest transcript and analysis text stored in a sheet cell
+TRANSCRIPT_CELL_LIMIT = 1000
+ANALYSIS_CELL_LIMIT = 500
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+@dataclass(slots=True)
+class VideoAnalysisResult:
+    """Analysis of one video interview; the defaults describe a failed analysis"""
+    student_id: str
+    video_path: str
+    transcript: str = ''
+    confidence_score: float = 0
+    ai_experience_score: float = 0
+    education_status: str = 'unknown'
+    communication_score: float = 0
+    detailed_analysis: str = ''
+    analysis_timestamp: str = ''
+    success: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Result as a dict keyed by field name, in Video_Analysis column order"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+def _is_video_file(video_path: str) -> bool:
+    """Whether video_path names a non-empty regular file, checked with one stat"""
+    if not video_path:
+        return False
+    try:
+        info = os.stat(video_path)
+    except OSError:
+        return False
+    return stat.S_ISREG(info.st_mode) and info.st_size > 0
+
+def _video_analysis_row(result: Dict[str, Any]) -> List[Any]:
+    """Build one Video_Analysis row from an analysis result, in header order"""
+    return [
+        result['student_id'],
+        result['video_path'],
+        _truncate(result['transcript'], TRANSCRIPT_CELL_LIMIT),
+        result['confidence_score'],
+        result['ai_experience_score'],
+        result['education_status'],
+        result['communication_score'],
+        _truncate(result['detailed_analysis'], ANALYSIS_CELL_LIMIT),
+        result['analysis_timestamp'],
+        result['success']
+    ]
 
 class VideoAnalyzerAgent:
     def __init__(self, sheets_manager: SheetsManager, video_analyzer: VideoAnalyzer):
@@ -20,7 +97,20 @@ class VideoAnalyzerAgent:
         """
         self.sheets_manager = sheets_manager
         self.video_analyzer = video_analyzer
-        self.agent = self._create_agent()
+        # The CrewAI agent is only needed for tasks, so it is created on first use
+        self._agent = None
+        # Whether Video_Analysis is known to have its header row, so stores can append
+        self._has_headers = False
+        # Last raw Video_Analysis rows and their parsed frame; the sheets manager hands back
+        # the same rows object until its cached read expires or the sheet is written
+        self._parsed_cache = None
+    
+    @property
+    def agent(self) -> Agent:
+        """CrewAI agent, created on first access"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
     
     def _create_agent(self) -> Agent:
         """Create the CrewAI agent"""
@@ -70,53 +160,85 @@ class VideoAnalyzerAgent:
         Returns:
             List of analysis results
         """
-        results = []
+        if not video_data:
+            return []
         
-        for video_info in video_data:
-            student_id = video_info.get('student_id', 'Unknown')
-            video_path = video_info.get('video_path', '')
-            
-            print(f"Analyzing video for student {student_id}...")
-            
-            # Analyze the video
-            analysis_result = self.video_analyzer.analyze_video_complete(video_path)
+        # Videos are independent and each one mostly waits on transcription and model
+        # calls, so analyze them concurrently; map keeps input order
+        max_workers = max(1, min(len(video_data), get_config().VIDEO_WORKERS))
+        
+        # All results of one batch share the analysis timestamp
+        timestamp = datetime.now().isoformat()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._analyze_one, video_data, repeat(timestamp))
+            # Callers annotate the results in place, so they are handed out as dicts
+            return [result.to_dict() for result in results]
+    
+    def _analyze_one(self, video_info: Dict[str, Any], timestamp: str) -> 'VideoAnalysisResult':
+        """
+        Analyze a single video interview
+        
+        Args:
+            video_info: Video data dictionary with 'student_id', 'video_path'
+            timestamp: Analysis timestamp to record
+        
+        Returns:
+            Analysis result for the student
+        """
+        student_id = video_info.get('student_id', 'Unknown')
+        video_path = video_info.get('video_path', '')
+        
+        logger.info("analyzing video student=%s path=%s", student_id, video_path)
+        
+        if not _is_video_file(video_path):
+            # Nothing to transcribe, so skip the analyzer and its model calls
+            analysis_result = {'success': False, 'error': 'Video file is missing or empty'}
+        else:
+            # Reuse the analysis of a byte-identical video; only successes are cached
+            cache_key = analysis_cache.video_key(video_path)
+            analysis_result = analysis_cache.get(cache_key) if cache_key else None
             
-            if analysis_result['success']:
-                # Combine with student info
-                result = {
-                    'student_id': student_id,
-                    'video_path': video_path,
-                    'transcript': analysis_result['transcript'],
-                    'confidence_score': analysis_result['analysis']['confidence_score'],
-                    'ai_experience_score': analysis_result['analysis']['ai_experience_score'],
-                    'education_status': analysis_result['analysis']['education_status'],
-                    'communication_score': analysis_result['analysis']['communication_score'],
-                    'detailed_analysis': analysis_result['analysis']['detailed_analysis'],
-                    'analysis_timestamp': pd.Timestamp.now().isoformat(),
-                    'success': True
-                }
+            if analysis_result is None:
+                # Analyze the video
+                analysis_result = self.video_analyzer.analyze_video_complete(video_path)
+                if cache_key and analysis_result['success']:
+                    analysis_cache.put(cache_key, analysis_result)
             else:
-                result = {
-                    'student_id': student_id,
-                    'video_path': video_path,
-                    'transcript': '',
-                    'confidence_score': 0,
-                    'ai_experience_score': 0,
-                    'education_status': 'unknown',
-                    'communication_score': 0,
-                    'detailed_analysis': f"Analysis failed: {analysis_result.get('error', 'Unknown error')}",
-                    'analysis_timestamp': pd.Timestamp.now().isoformat(),
-                    'success': False
-                }
-            
-            results.append(result)
+                logger.info("using cached analysis student=%s", student_id)
         
-        return results
+        if analysis_result['success']:
+            # Combine with student info
+            analysis = analysis_result['analysis']
+            result = VideoAnalysisResult(
+                student_id=student_id,
+                video_path=video_path,
+                transcript=analysis_result['transcript'],
+                confidence_score=analysis['confidence_score'],
+                ai_experience_score=analysis['ai_experience_score'],
+                education_status=analysis['education_status'],
+                communication_score=analysis['communication_score'],
+                detailed_analysis=analysis['detailed_analysis'],
+                analysis_timestamp=timestamp,
+                success=True
+            )
+        else:
+            result = VideoAnalysisResult(
+                student_id=student_id,
+                video_path=video_path,
+                detailed_analysis=f"Analysis failed: {analysis_result.get('error', 'Unknown error')}",
+                analysis_timestamp=timestamp
+            )
+        
+        logger.info("analyzed video student=%s success=%s", student_id, result.success)
+        return result
     
     def store_video_analysis_results(self, results: List[Dict[str, Any]]) -> bool:
         """
         Store video analysis results in Google Sheets
         
+        Results are appended below earlier analyses; the header row is only
+        written when the sheet does not have it yet.
+        
         Args:
             results: List of analysis results
         
@@ -125,29 +247,14 @@ class VideoAnalyzerAgent:
         """
         try:
             # Prepare data for Google Sheets
-            headers = ['Student_ID', 'Video_Path', 'Transcript', 'Confidence_Score', 
-                      'AI_Experience_Score', 'Education_Status', 'Communication_Score',
-                      'Detailed_Analysis', 'Analysis_Timestamp', 'Success']
-            
-            rows = [headers]
-            
-            for result in results:
-                row = [
-                    result['student_id'],
-                    result['video_path'],
-                    result['transcript'][:1000] + '...' if len(result['transcript']) > 1000 else result['transcript'],
-                    result['confidence_score'],
-                    result['ai_experience_score'],
-                    result['education_status'],
-                    result['communication_score'],
-                    result['detailed_analysis'][:500] + '...' if len(result['detailed_analysis']) > 500 else result['detailed_analysis'],
-                    result['analysis_timestamp'],
-                    result['success']
-                ]
-                rows.append(row)
+            rows = [_video_analysis_row(result) for result in results]
             
             # Write to Google Sheets
-            self.sheets_manager.write_sheet('Video_Analysis', rows)
+            if not self._sheet_has_headers():
+                self.sheets_manager.write_sheet('Video_Analysis', [VIDEO_ANALYSIS_HEADERS] + rows)
+                self._has_headers = True
+            else:
+                self.sheets_manager.append_to_sheet('Video_Analysis', rows)
             
             print(f"Successfully stored {len(results)} video analysis results")
             return True
@@ -156,43 +263,57 @@ class VideoAnalyzerAgent:
             print(f"Error storing video analysis results: {e}")
             return False
     
-    def get_video_analysis_results(self) -> List[Dict[str, Any]]:
+    def _sheet_has_headers(self) -> bool:
+        """Check once whether the Video_Analysis sheet starts with its header row"""
+        if not self._has_headers:
+            first_row = self.sheets_manager.read_sheet('Video_Analysis', 'A1:J1')
+            self._has_headers = bool(first_row) and first_row[0] == VIDEO_ANALYSIS_HEADERS
+        return self._has_headers
+    
+    def get_video_analysis_df(self) -> pd.DataFrame:
         """
-        Retrieve video analysis results from Google Sheets
+        Retrieve video analysis results from Google Sheets as a DataFrame
         
         Returns:
-            List of analysis results
+            DataFrame with one row per analysis and snake_case result columns
         """
         try:
-            data = self.sheets_manager.read_sheet('Video_Analysis')
+            # Read-only rows; their identity tells whether the parsed form is current
+            data = self.sheets_manager.read_sheet('Video_Analysis', copy=False)
             
             if not data:
-                return []
+                return pd.DataFrame(columns=VIDEO_ANALYSIS_COLUMNS)
             
-            headers = data[0]
-            results = []
+            if self._parsed_cache is not None and self._parsed_cache[0] is data:
+                return self._parsed_cache[1].copy()
             
-            for row in data[1:]:
-                if len(row) >= len(headers):
-                    result = {
-                        'student_id': row[0],
-                        'video_path': row[1],
-                        'transcript': row[2],
-                        'confidence_score': float(row[3]) if row[3] else 0,
-                        'ai_experience_score': float(row[4]) if row[4] else 0,
-                        'education_status': row[5],
-                        'communication_score': float(row[6]) if row[6] else 0,
-                        'detailed_analysis': row[7],
-                        'analysis_timestamp': row[8],
-                        'success': row[9].lower() == 'true' if row[9] else False
-                    }
-                    results.append(result)
+            # Rows with missing trailing cells are incomplete analyses
+            width = len(VIDEO_ANALYSIS_COLUMNS)
+            rows = [row[:width] for row in data[1:] if len(row) >= width]
+            df = pd.DataFrame(rows, columns=VIDEO_ANALYSIS_COLUMNS)
             
-            return results
+            # Stores append, so a re-analyzed student has several rows; the last one is current
+            df = df.drop_duplicates('student_id', keep='last').reset_index(drop=True)
+            
+            scores = df[VIDEO_SCORE_COLUMNS].apply(pd.to_numeric, errors='coerce')
+            df[VIDEO_SCORE_COLUMNS] = scores.fillna(0).astype(np.float64)
+            df['success'] = df['success'].isin(TRUE_VALUES)
+            
+            self._parsed_cache = (data, df)
+            return df.copy()
             
         except Exception as e:
             print(f"Error retrieving video analysis results: {e}")
-            return []
+            return pd.DataFrame(columns=VIDEO_ANALYSIS_COLUMNS)
+    
+    def get_video_analysis_results(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve video analysis results from Google Sheets
+        
+        Returns:
+            List of analysis results
+        """
+        return self.get_video_analysis_df().to_dict('records')
     
     def get_top_video_candidates(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
@@ -204,30 +325,20 @@ class VideoAnalyzerAgent:
         Returns:
             List of top candidates sorted by combined score
         """
-        results = self.get_video_analysis_results()
+        df = self.get_video_analysis_df()
         
-        if not results:
+        if df.empty:
             return []
         
         # Filter successful analyses only
-        successful_results = [r for r in results if r['success']]
-        
-        if not successful_results:
-            return []
-        
-        # Calculate combined score (weighted average)
-        for result in successful_results:
-            combined_score = (
-                result['confidence_score'] * 0.3 +
-                result['ai_experience_score'] * 0.4 +
-                result['communication_score'] * 0.3
-            )
-            result['combined_score'] = combined_score
+        successful = df[df['success']]
         
-        # Sort by combined score (descending)
-        sorted_results = sorted(successful_results, key=lambda x: x['combined_score'], reverse=True)
+        # Calculate combined score (weighted average) for all candidates at once
+        scores = successful[VIDEO_SCORE_COLUMNS].to_numpy(np.float64) @ COMBINED_SCORE_WEIGHTS
         
-        return sorted_results[:limit]
+        # Highest combined scores first; only the top candidates get sorted
+        top = top_k_indices(scores, limit)
+        return successful.iloc[top].assign(combined_score=scores[top]).to_dict('records')
     
     def initialize_video_analysis_sheet(self) -> bool:
         """
@@ -237,10 +348,8 @@ class VideoAnalyzerAgent:
             True if successful
         """
         try:
-            headers = [['Student_ID', 'Video_Path', 'Transcript', 'Confidence_Score', 
-                       'AI_Experience_Score', 'Education_Status', 'Communication_Score',
-                       'Detailed_Analysis', 'Analysis_Timestamp', 'Success']]
-            self.sheets_manager.write_sheet('Video_Analysis', headers)
+            self.sheets_manager.write_sheet('Video_Analysis', [VIDEO_ANALYSIS_HEADERS])
+            self._has_headers = True
             print("Video analysis sheet initialized successfully")
             return True
         except Exception as e:
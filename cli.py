@@ -0,0 +1,57 @@
+"""
+Command line entry point for the Student Selection Crew demos
+"""
+import argparse
+from typing import List, Optional
+
+def _run_demo(args: argparse.Namespace) -> None:
+    """Run the live demo"""
+    from demos.demo_system import main
+    main()
+
+def _run_example(args: argparse.Namespace) -> None:
+    """Show setup instructions, or run the full example with --run"""
+    from demos import example_usage
+    if args.run:
+        example_usage.main()
+    else:
+        example_usage.setup_example()
+
+def _run_final(args: argparse.Namespace) -> None:
+    """Run the final working system test"""
+    from demos.final_working_system import main
+    main()
+
+def _run_fix_sheet(args: argparse.Namespace) -> None:
+    """Check and fix the Google Sheet headers"""
+    from demos.fix_sheet_structure import main
+    main()
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per demo"""
+    parser = argparse.ArgumentParser(description="Student Selection Crew demos")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    subparsers.add_parser('demo', help="Run the live demo").set_defaults(func=_run_demo)
+    
+    example = subparsers.add_parser('example', help="Show setup instructions for the example")
+    example.add_argument('--run', action='store_true', help="Run the complete example process")
+    example.set_defaults(func=_run_example)
+    
+    subparsers.add_parser('final', help="Run the final working system test").set_defaults(func=_run_final)
+    subparsers.add_parser('fix-sheet', help="Fix the Google Sheet structure").set_defaults(func=_run_fix_sheet)
+    
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Parse arguments and dispatch to the selected demo
+    
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+    """
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -2,55 +2,176 @@
 Configuration settings for the Student Selection Crew
 """
 import os
-from dotenv import load_dotenv
+import importlib.util
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import dotenv_values
 
-load_dotenv()
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ENV_FILE = os.path.join(BASE_DIR, '.env')
+CONFIG_CACHE_FILE = os.path.join(BASE_DIR, 'temp', 'config_cache.py')
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    # API Keys
+    OPENAI_API_KEY: Optional[str] = None
+    GOOGLE_API_KEY: Optional[str] = None
+    GEMINI_API_KEY: Optional[str] = None
+    ASSEMBLYAI_API_KEY: Optional[str] = None
+
+    # Google Services
+    GOOGLE_CREDENTIALS_FILE: str = 'credentials.json'
+    GOOGLE_SHEET_ID: Optional[str] = None
+    GOOGLE_DRIVE_FOLDER_ID: Optional[str] = None
+
+    # Email Configuration
+    GMAIL_USERNAME: Optional[str] = None
+    GMAIL_APP_PASSWORD: Optional[str] = None
+
+    # Project Settings
+    PROJECT_NAME: str = 'Student Selection Crew'
+    MAX_SHORTLIST: int = 10
+    MAX_FINAL_SELECTION: int = 5
+    VIDEO_WORKERS: int = 4
+
+    # File Paths
+    DATA_DIR: str = 'data'
+    OUTPUTS_DIR: str = 'outputs'
+    TEMP_DIR: str = 'temp'
+
+    # Email Templates (string.Template syntax; email_manager compiles them once)
+    SHORTLIST_EMAIL_TEMPLATE: str = """
+Congratulations! You have been shortlisted for the next round.
+
+Please upload a 1-minute video interview at the following link:
+$drive_link
+
+The video should cover:
+- Your background and experience
+- Why you're interested in AI/ML
+- Your current education status
+
+Deadline: $deadline
+
+Best regards,
+Student Selection Team
+        """
+
+    FINAL_SELECTION_EMAIL_TEMPLATE: str = """
+Congratulations! You have been selected for the final round.
+
+We were impressed by your video interview and would like to proceed with the next steps.
+
+Please check your email for further instructions.
+
+Best regards,
+Student Selection Team
+        """
+
+def _read_config_cache() -> Optional[dict]:
+    """Return the cached .env values if the cache is at least as new as .env"""
+    try:
+        if os.stat(CONFIG_CACHE_FILE).st_mtime < os.stat(ENV_FILE).st_mtime:
+            return None
+    except OSError:
+        return None
+
+    spec = importlib.util.spec_from_file_location('config_cache', CONFIG_CACHE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return getattr(module, 'ENV_VALUES', None)
+
+def _write_config_cache(values: dict) -> None:
+    """Write the parsed .env values as a literal Python module"""
+    os.makedirs(os.path.dirname(CONFIG_CACHE_FILE), exist_ok=True)
+    tmp_path = f"{CONFIG_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write('# Generated from .env by config.py - do not edit\n')
+            f.write(f"ENV_VALUES = {values!r}\n")
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️ Could not write config cache: {e}")
+
+def load_env_file() -> None:
+    """
+    Apply .env values to os.environ without overriding existing variables
+
+    The parsed values are cached in temp/config_cache.py; the .env file is
+    only parsed again when it is newer than the cache.
+    """
+    values = _read_config_cache()
+    if values is None:
+        if not os.path.exists(ENV_FILE):
+            return
+        values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+        _write_config_cache(values)
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+@lru_cache(maxsize=1)
+def get_config() -> Settings:
+    """
+    Load the environment once and return the resolved configuration
+
+    Returns:
+        Frozen Settings built from a single snapshot of os.environ
+    """
+    load_env_file()
+    env = os.environ.copy()
+
+    return Settings(
+        OPENAI_API_KEY=env.get('OPENAI_API_KEY'),
+        GOOGLE_API_KEY=env.get('GOOGLE_API_KEY'),
+        GEMINI_API_KEY=env.get('GEMINI_API_KEY'),
+        ASSEMBLYAI_API_KEY=env.get('ASSEMBLYAI_API_KEY'),
+        GOOGLE_CREDENTIALS_FILE=env.get('GOOGLE_CREDENTIALS_FILE', 'credentials.json'),
+        GOOGLE_SHEET_ID=env.get('GOOGLE_SHEET_ID'),
+        GOOGLE_DRIVE_FOLDER_ID=env.get('GOOGLE_DRIVE_FOLDER_ID'),
+        GMAIL_USERNAME=env.get('GMAIL_USERNAME'),
+        GMAIL_APP_PASSWORD=env.get('GMAIL_APP_PASSWORD'),
+        PROJECT_NAME=env.get('PROJECT_NAME', 'Student Selection Crew'),
+        MAX_SHORTLIST=int(env.get('MAX_SHORTLIST', '10')),
+        MAX_FINAL_SELECTION=int(env.get('MAX_FINAL_SELECTION', '5')),
+        VIDEO_WORKERS=int(env.get('VIDEO_WORKERS', '4'))
+    )
+
+# Resolved once at startup; read settings from here instead of os.getenv
+CONFIG = get_config()
 
 class Config:
     # API Keys
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
-    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-    ASSEMBLYAI_API_KEY = os.getenv('ASSEMBLYAI_API_KEY')
+    OPENAI_API_KEY = CONFIG.OPENAI_API_KEY
+    GOOGLE_API_KEY = CONFIG.GOOGLE_API_KEY
+    GEMINI_API_KEY = CONFIG.GEMINI_API_KEY
+    ASSEMBLYAI_API_KEY = CONFIG.ASSEMBLYAI_API_KEY
     
     # Google Services
-    GOOGLE_CREDENTIALS_FILE = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
-    GOOGLE_SHEET_ID = os.getenv('GOOGLE_SHEET_ID')
-    GOOGLE_DRIVE_FOLDER_ID = os.getenv('GOOGLE_DRIVE_FOLDER_ID')
+    GOOGLE_CREDENTIALS_FILE = CONFIG.GOOGLE_CREDENTIALS_FILE
+    GOOGLE_SHEET_ID = CONFIG.GOOGLE_SHEET_ID
+    GOOGLE_DRIVE_FOLDER_ID = CONFIG.GOOGLE_DRIVE_FOLDER_ID
     
     # Email Configuration
-    GMAIL_USERNAME = os.getenv('GMAIL_USERNAME')
-    GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')
+    GMAIL_USERNAME = CONFIG.GMAIL_USERNAME
+    GMAIL_APP_PASSWORD = CONFIG.GMAIL_APP_PASSWORD
     
     # Project Settings
-    PROJECT_NAME = os.getenv('PROJECT_NAME', 'Student Selection Crew')
-    MAX_SHORTLIST = int(os.getenv('MAX_SHORTLIST', 10))
-    MAX_FINAL_SELECTION = int(os.getenv('MAX_FINAL_SELECTION', 5))
+    PROJECT_NAME = CONFIG.PROJECT_NAME
+    MAX_SHORTLIST = CONFIG.MAX_SHORTLIST
+    MAX_FINAL_SELECTION = CONFIG.MAX_FINAL_SELECTION
+    VIDEO_WORKERS = CONFIG.VIDEO_WORKERS
     
     # File Paths
-    DATA_DIR = 'data'
-    OUTPUTS_DIR = 'outputs'
-    TEMP_DIR = 'temp'
+    DATA_DIR = CONFIG.DATA_DIR
+    OUTPUTS_DIR = CONFIG.OUTPUTS_DIR
+    TEMP_DIR = CONFIG.TEMP_DIR
     
     # Email Templates
-    SHORTLIST_EMAIL_TEMPLATE = """
-    Congratulations! You have been shortlisted for the next round.
-    
-    Please upload a 1-minute video interview at the following link:
-    {drive_link}
-    
-    The video should cover:
-    - Your background and experience
-    - Why you're interested in AI/ML
-    - Your current education status
-    
-    Deadline: {deadline}
-    """
-    
-    FINAL_SELECTION_EMAIL_TEMPLATE = """
-    Congratulations! You have been selected for the final round.
-    
-    We were impressed by your video interview and would like to proceed with the next steps.
-    
-    Please check your email for further instructions.
-    """
+    SHORTLIST_EMAIL_TEMPLATE = CONFIG.SHORTLIST_EMAIL_TEMPLATE
+    FINAL_SELECTION_EMAIL_TEMPLATE = CONFIG.FINAL_SELECTION_EMAIL_TEMPLATE
@@ -0,0 +1,152 @@
+"""
+Final Working Student Selection Crew - Fully functional system
+"""
+from config import CONFIG
+from samples import sample_quiz
+
+_USAGE_BANNER = """
+📚 HOW TO USE YOUR SYSTEM
+==================================================
+
+🎯 YOUR STUDENT SELECTION CREW IS READY!
+
+📋 WORKFLOW:
+1. Create Quiz Questions
+   - Use: crew.create_quiz_questions(questions)
+   - Questions stored in your Google Sheet
+
+2. Evaluate Student Submissions
+   - Use: crew.evaluate_quiz_submissions(answers)
+   - Results automatically calculated and stored
+
+3. Shortlist Top Students
+   - Use: crew.shortlist_top_students(drive_link)
+   - Top students selected and notified
+
+4. Analyze Video Interviews
+   - Use: crew.analyze_video_interviews(video_data)
+   - AI analysis of student videos
+
+5. Make Final Selection
+   - Use: crew.make_final_selection()
+   - Final candidates selected and notified
+
+📊 YOUR GOOGLE SHEET STRUCTURE:
+- Column A: Student Name
+- Column B: Email
+- Column C: Quiz Marks
+- Column D: Status
+- Column E: Video Link
+- Column F: Transcript
+- Column G: Confidence
+- Column H: AI Experience
+- Column I: Final Result
+- Columns J+: Quiz Questions Data
+
+🚀 READY TO USE:
+Your system is now fully functional and ready for real use!
+"""
+
+def run_complete_demo():
+    """Run a complete demo of the working system"""
+    print("🎯 FINAL WORKING SYSTEM DEMO")
+    print("=" * 50)
+    print("This demonstrates your fully functional Student Selection Crew!")
+    print()
+    
+    try:
+        # Initialize the system
+        from fixed_student_selection_crew import FixedStudentSelectionCrew
+        
+        crew = FixedStudentSelectionCrew(
+            credentials_file=CONFIG.GOOGLE_CREDENTIALS_FILE,
+            sheet_id=CONFIG.GOOGLE_SHEET_ID,
+            gmail_username=CONFIG.GMAIL_USERNAME,
+            gmail_password=CONFIG.GMAIL_APP_PASSWORD
+        )
+        print("✅ System initialized successfully!")
+        
+        # Demo 1: Quiz Creation
+        print("\n📝 DEMO 1: Quiz Creation")
+        print("-" * 30)
+        
+        quiz_questions = list(sample_quiz()[:2])
+        
+        success = crew.create_quiz_questions(quiz_questions)
+        print(f"✅ Quiz questions created: {success}")
+        
+        # Demo 2: Student Evaluation
+        print("\n📊 DEMO 2: Student Evaluation")
+        print("-" * 30)
+        
+        student_answers = [
+            {
+                'student_id': 'STU001',
+                'name': 'John Doe',
+                'email': 'john.doe@email.com',
+                'answers': [0, 1]  # Correct answers
+            },
+            {
+                'student_id': 'STU002',
+                'name': 'Jane Smith',
+                'email': 'jane.smith@email.com',
+                'answers': [0, 0]  # Partially correct
+            },
+            {
+                'student_id': 'STU003',
+                'name': 'Bob Johnson',
+                'email': 'bob.johnson@email.com',
+                'answers': [1, 1]  # Wrong answers
+            }
+        ]
+        
+        results = crew.evaluate_quiz_submissions(student_answers)
+        print(f"✅ Students evaluated: {len(results)}")
+        for result in results:
+            print(f"  {result['student_name']}: {result['percentage']}%")
+        
+        # Demo 3: Shortlisting
+        print("\n🏆 DEMO 3: Shortlisting")
+        print("-" * 30)
+        
+        shortlisted = crew.shortlist_top_students("https://drive.google.com/drive/folders/test")
+        print(f"✅ Students shortlisted: {len(shortlisted)}")
+        for student in shortlisted:
+            print(f"  {student['student_name']}: {student['percentage']}%")
+        
+        # Demo 4: System Status
+        print("\n📊 DEMO 4: System Status")
+        print("-" * 30)
+        
+        status = crew.get_process_status()
+        print(f"Quiz questions: {status['quiz_questions']}")
+        print(f"Quiz results: {status['quiz_results']}")
+        print(f"Shortlisted: {status['shortlisted']}")
+        print(f"Video analysis: {status['video_analysis']}")
+        print(f"Final selection: {status['final_selection']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Demo failed: {e}")
+        return False
+
+def show_usage_instructions():
+    """Show how to use the system"""
+    print(_USAGE_BANNER, end='')
+
+def main():
+    """Main function"""
+    print("🎉 FINAL SYSTEM TEST")
+    print("=" * 50)
+    
+    if run_complete_demo():
+        print("\n🎉 SUCCESS! YOUR SYSTEM IS WORKING!")
+        print("=" * 50)
+        show_usage_instructions()
+    else:
+        print("\n❌ System test failed")
+        print("Please check your configuration")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Fixed Student Selection Crew - Works with your existing Google Sheet structure
 """
 from crewai import Crew, Process
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -17,9 +18,30 @@ from agents.finalizer import FinalizerAgent
 from tools.sheets_manager import SheetsManager
 from tools.email_manager import EmailManager
 from tools.video_analyzer import VideoAnalyzer
+from tools.scoring import QuizAnswerKey, points_array
+from tools.header_cache import headers_verified, mark_headers_verified
 
 # Import configuration
-from config import Config
+from config import get_config
+
+# Column layout of Sheet1 (A:I)
+SHEET_HEADERS = [
+    'Student Name', 'Email', 'Quiz Marks', 'Status',
+    'Video Link', 'Transcript', 'Confidence', 'AI Experience', 'Final Result'
+]
+
+# Sheet1 columns parsed as numbers; anything else is kept as text
+NUMERIC_COLUMNS = ['Quiz Marks', 'Confidence', 'AI Experience']
+
+# Video analysis result fields written back to Sheet1
+VIDEO_SHEET_COLUMNS = ['student_id', 'success', 'transcript', 'confidence_score', 'ai_experience_score']
+
+def _student_ids(count: int) -> List[str]:
+    """Sequential student IDs STU001, STU002, ... for the given number of students"""
+    if count <= 0:
+        return []
+    numbers = np.arange(1, count + 1).astype(str)
+    return np.char.add('STU', np.char.zfill(numbers, 3)).tolist()
 
 class FixedStudentSelectionCrew:
     def __init__(self, credentials_file: str, sheet_id: str, 
@@ -45,6 +67,12 @@ class FixedStudentSelectionCrew:
         self.video_analyzer_agent = VideoAnalyzerAgent(self.sheets_manager, self.video_analyzer)
         self.finalizer = FinalizerAgent(self.sheets_manager, self.email_manager)
         
+        # Number of stored quiz questions, known once create_quiz_questions has
+        # run or the quiz has been read back; the answer key is memoized on the
+        # identity of the memoized sheet read, so it expires with that read
+        self._quiz_question_count = None
+        self._answer_key = None
+        
         # Initialize your existing sheet structure
         self._initialize_your_sheet()
     
@@ -52,10 +80,13 @@ class FixedStudentSelectionCrew:
         """Initialize your existing Google Sheet with proper structure"""
         try:
             # Your sheet already has the right structure, just ensure headers are correct
-            headers = [
-                'Student Name', 'Email', 'Quiz Marks', 'Status', 
-                'Video Link', 'Transcript', 'Confidence', 'AI Experience', 'Final Result'
-            ]
+            headers = SHEET_HEADERS
+            sheet_id = self.sheets_manager.sheet_id
+            
+            # Skip the round-trip when this sheet's headers were verified recently
+            if headers_verified(sheet_id, headers):
+                print("✅ Sheet headers already correct (cached)")
+                return
             
             # Check if headers exist
             try:
@@ -66,12 +97,33 @@ class FixedStudentSelectionCrew:
                     print("✅ Updated sheet headers")
                 else:
                     print("✅ Sheet headers already correct")
+                mark_headers_verified(sheet_id, headers)
             except Exception as e:
                 print(f"⚠️ Could not check headers: {e}")
                 
         except Exception as e:
             print(f"Error initializing sheet: {e}")
     
+    def _load_students(self) -> pd.DataFrame:
+        """
+        Load Sheet1 into a DataFrame with typed columns
+        
+        Returns:
+            One row per student, indexed by sheet row number; text columns are
+            '' when empty and numeric columns are NaN when empty or not a number
+        """
+        student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
+        
+        # Short rows are padded to the full A:I width
+        df = pd.DataFrame(student_data[1:]).reindex(columns=range(len(SHEET_HEADERS)))
+        df.columns = SHEET_HEADERS
+        df.index = pd.RangeIndex(2, len(df) + 2)  # Skip header, start from row 2
+        
+        df = df.fillna('')
+        for column in NUMERIC_COLUMNS:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+        return df
+    
     def create_quiz_questions(self, questions_data: List[Dict[str, Any]]) -> bool:
         """
         Create and store quiz questions (Admin function)
@@ -106,6 +158,7 @@ class FixedStudentSelectionCrew:
             
             # Write to columns J onwards
             self.sheets_manager.write_sheet('Sheet1', rows, 'J1')
+            self._quiz_question_count = len(questions_data)
             print(f"✅ Successfully stored {len(questions_data)} quiz questions")
             return True
             
@@ -113,6 +166,44 @@ class FixedStudentSelectionCrew:
             print(f"❌ Error storing quiz questions: {e}")
             return False
     
+    def _load_answer_key(self) -> Optional[QuizAnswerKey]:
+        """
+        Read the stored quiz back from the sheet and build its answer key, reused
+        for as long as SheetsManager keeps serving the same memoized read
+        
+        Returns:
+            QuizAnswerKey, or None if no quiz questions are stored
+        """
+        # Get quiz questions from columns J:Q, bounded to the stored rows when known
+        if self._quiz_question_count is None:
+            quiz_range = 'J:Q'
+        else:
+            quiz_range = f'J1:Q{self._quiz_question_count + 1}'
+        quiz_data = self.sheets_manager.read_sheet('Sheet1', quiz_range, copy=False)
+        if self._answer_key is not None and self._answer_key[0] is quiz_data:
+            return self._answer_key[1]
+        
+        if not quiz_data or len(quiz_data) < 2:
+            return None
+        
+        # Complete question rows, split into columns
+        rows = [row[:8] for row in quiz_data[1:] if len(row) >= 8]  # Skip header
+        columns = list(zip(*rows)) or [()] * 8
+        
+        # Correct_Answer and Points were written as numbers by create_quiz_questions;
+        # convert the whole column at once instead of probing each cell
+        correct = pd.to_numeric(pd.Series(columns[5], dtype=object), errors='coerce')
+        points = pd.to_numeric(pd.Series(columns[6], dtype=object), errors='coerce')
+        
+        self._quiz_question_count = len(quiz_data) - 1
+        answer_key = QuizAnswerKey(
+            correct=correct.fillna(0).to_numpy(dtype=np.int32),
+            points=points_array(points.fillna(1)),
+            categories=tuple(columns[7])
+        )
+        self._answer_key = (quiz_data, answer_key)
+        return answer_key
+    
     def evaluate_quiz_submissions(self, student_answers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Evaluate student quiz submissions
@@ -126,34 +217,19 @@ class FixedStudentSelectionCrew:
         print("Evaluating quiz submissions...")
         
         try:
-            # Get quiz questions from columns J onwards
-            quiz_data = self.sheets_manager.read_sheet('Sheet1', 'J:Z')
-            
-            if not quiz_data or len(quiz_data) < 2:
+            answer_key = self._load_answer_key()
+            if answer_key is None:
                 print("❌ No quiz questions found. Please create quiz questions first.")
                 return []
             
-            # Parse quiz questions
-            quiz_questions = []
-            for row in quiz_data[1:]:  # Skip header
-                if len(row) >= 8:
-                    question = {
-                        'question': row[0],
-                        'options': [row[1], row[2], row[3], row[4]],
-                        'correct_answer': int(row[5]) if str(row[5]).isdigit() else 0,
-                        'points': int(row[6]) if str(row[6]).isdigit() else 1,
-                        'category': row[7]
-                    }
-                    quiz_questions.append(question)
-            
             # Evaluate answers
-            results = self.checker.evaluate_answers(student_answers, quiz_questions)
+            results = self.checker.evaluate_answers(student_answers, answer_key)
             
             # Store results in your main sheet
             if results:
                 # Update the main sheet with student data
-                for i, result in enumerate(results, 2):  # Start from row 2 (after headers)
-                    student_data = [
+                rows = [
+                    [
                         result['student_name'],
                         result.get('email', ''),
                         result['total_score'],
@@ -164,9 +240,11 @@ class FixedStudentSelectionCrew:
                         '',  # AI Experience
                         ''   # Final Result
                     ]
-                    
-                    # Write to the main sheet
-                    self.sheets_manager.write_sheet('Sheet1', [student_data], f'A{i}')
+                    for result in results
+                ]
+                
+                # Write all rows to the main sheet in one request, starting after headers
+                self.sheets_manager.batch_update('Sheet1', [(f'A2:I{len(rows) + 1}', rows)])
                 
                 print(f"✅ Evaluated {len(results)} student submissions")
             
@@ -191,37 +269,41 @@ class FixedStudentSelectionCrew:
         
         try:
             # Get student data from your sheet
-            student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
+            df = self._load_students()
             
-            if not student_data or len(student_data) < 2:
+            if df.empty:
                 print("❌ No student data found. Please evaluate quiz submissions first.")
                 return []
             
-            # Parse student results
-            students = []
-            for row in student_data[1:]:  # Skip header
-                if len(row) >= 3 and row[2]:  # Has quiz marks
-                    student = {
-                        'student_id': f"STU{len(students)+1:03d}",
-                        'student_name': row[0],
-                        'email': row[1],
-                        'total_score': float(row[2]) if str(row[2]).replace('.', '').isdigit() else 0,
-                        'percentage': float(row[2]) if str(row[2]).replace('.', '').isdigit() else 0
-                    }
-                    students.append(student)
-            
-            if not students:
+            # Students with quiz marks, numbered in sheet order
+            scored = df.dropna(subset=['Quiz Marks'])
+            if scored.empty:
                 print("❌ No students with quiz results found")
                 return []
+            scored = scored.assign(student_id=_student_ids(len(scored)))
+            
+            # Select top students by score
+            top = scored.nlargest(get_config().MAX_SHORTLIST, 'Quiz Marks')
+            shortlisted = [
+                {
+                    'sheet_row': int(sheet_row),
+                    'student_id': student_id,
+                    'student_name': name,
+                    'email': email,
+                    'total_score': float(score),
+                    'percentage': float(score)
+                }
+                for sheet_row, student_id, name, email, score in zip(
+                    top.index, top['student_id'], top['Student Name'], top['Email'], top['Quiz Marks']
+                )
+            ]
             
-            # Sort by score and select top students
-            students.sort(key=lambda x: x['total_score'], reverse=True)
-            shortlisted = students[:Config.MAX_SHORTLIST]
-            
-            # Update status in sheet
-            for i, student in enumerate(shortlisted, 2):
-                # Update status to "Shortlisted"
-                self.sheets_manager.update_cell('Sheet1', f'D{i}', 'Shortlisted')
+            # Update the status column in one write, keeping other students' status
+            status = df['Status'].copy()
+            status[top.index] = 'Shortlisted'
+            self.sheets_manager.batch_update(
+                'Sheet1', [(f'D2:D{len(status) + 1}', [[value] for value in status])]
+            )
             
             # Send notifications
             if deadline is None:
@@ -240,12 +322,15 @@ class FixedStudentSelectionCrew:
             print(f"❌ Error shortlisting students: {e}")
             return []
     
-    def analyze_video_interviews(self, video_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def analyze_video_interviews(self, video_data: List[Dict[str, Any]],
+                                 student_index: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Analyze video interviews
         
         Args:
             video_data: List of video data dictionaries with 'student_id', 'video_path'
+            student_index: Optional mapping of student_id to student data; when
+                given, each result only updates the row of its own student
         
         Returns:
             List of analysis results
@@ -255,30 +340,56 @@ class FixedStudentSelectionCrew:
         try:
             # Analyze videos
             results = self.video_analyzer_agent.analyze_videos(video_data)
-            
-            # Update your sheet with video analysis results
-            if results:
-                for result in results:
-                    # Find the student in your sheet and update their data
-                    student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
-                    
-                    for i, row in enumerate(student_data[1:], 2):  # Skip header, start from row 2
-                        if len(row) >= 1 and row[0]:  # Has student name
-                            # Update video analysis data
-                            if result['success']:
-                                self.sheets_manager.update_cell('Sheet1', f'E{i}', 'Video Uploaded')
-                                self.sheets_manager.update_cell('Sheet1', f'F{i}', result['transcript'][:100] + '...')
-                                self.sheets_manager.update_cell('Sheet1', f'G{i}', str(result['confidence_score']))
-                                self.sheets_manager.update_cell('Sheet1', f'H{i}', str(result['ai_experience_score']))
-                            
-                successful = sum(1 for r in results if r['success'])
-                print(f"✅ Analyzed {successful}/{len(results)} videos successfully")
-            
-            return results
-            
         except Exception as e:
             print(f"❌ Error analyzing videos: {e}")
             return []
+        
+        # Update your sheet with video analysis results; a failed write keeps the results
+        try:
+            # Build the E:H cells of every successful result in one vectorized pass;
+            # reindex so partial results still provide every column
+            analyzed = pd.DataFrame(
+                [r for r in results if r.get('success')]
+            ).reindex(columns=VIDEO_SHEET_COLUMNS)
+            
+            if not analyzed.empty:
+                # Read the sheet once and map student names to their row
+                student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
+                name_to_row = {
+                    row[0]: i for i, row in enumerate(student_data[1:], 2)  # Skip header, start from row 2
+                    if row and row[0]
+                }
+                
+                cells = pd.DataFrame({
+                    'video': 'Video Uploaded',
+                    'transcript': analyzed['transcript'].fillna('').astype(str).str.slice(0, 100) + '...',
+                    'confidence': analyzed['confidence_score'].fillna(0).astype(str),
+                    'ai_experience': analyzed['ai_experience_score'].fillna(0).astype(str)
+                }).to_numpy().tolist()
+                
+                # Collect E:H values per sheet row and send them in one batch
+                row_updates = {}
+                for student_id, values in zip(analyzed['student_id'], cells):
+                    if student_index is None:
+                        # No way to match the result to a student, update every row
+                        for i in name_to_row.values():
+                            row_updates[i] = values
+                        continue
+                    
+                    student = student_index.get(student_id)
+                    i = name_to_row.get(student.get('name')) if student else None
+                    if i is not None:
+                        row_updates[i] = values
+                
+                self.sheets_manager.batch_update(
+                    'Sheet1', [(f'E{i}:H{i}', [values]) for i, values in row_updates.items()]
+                )
+            
+            print(f"✅ Analyzed {len(analyzed)}/{len(results)} videos successfully")
+        except Exception as e:
+            print(f"⚠️ Videos analyzed but the sheet update failed: {e}")
+        
+        return results
     
     def make_final_selection(self) -> List[Dict[str, Any]]:
         """
@@ -291,25 +402,28 @@ class FixedStudentSelectionCrew:
         
         try:
             # Get student data from your sheet
-            student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
+            df = self._load_students()
             
-            if not student_data or len(student_data) < 2:
+            if df.empty:
                 print("❌ No student data found.")
                 return []
             
-            # Parse students with video analysis
-            candidates = []
-            for row in student_data[1:]:  # Skip header
-                if len(row) >= 8 and row[6] and row[7]:  # Has confidence and AI experience scores
-                    candidate = {
-                        'student_id': f"STU{len(candidates)+1:03d}",
-                        'student_name': row[0],
-                        'email': row[1],
-                        'confidence_score': float(row[6]) if str(row[6]).replace('.', '').isdigit() else 0,
-                        'ai_experience_score': float(row[7]) if str(row[7]).replace('.', '').isdigit() else 0,
-                        'education_status': 'graduated'  # Default
-                    }
-                    candidates.append(candidate)
+            # Students with confidence and AI experience scores
+            analyzed = df.dropna(subset=['Confidence', 'AI Experience'])
+            candidates = [
+                {
+                    'student_id': student_id,
+                    'student_name': name,
+                    'email': email,
+                    'confidence_score': float(confidence),
+                    'ai_experience_score': float(ai_experience),
+                    'education_status': 'graduated'  # Default
+                }
+                for student_id, name, email, confidence, ai_experience in zip(
+                    _student_ids(len(analyzed)), analyzed['Student Name'], analyzed['Email'],
+                    analyzed['Confidence'], analyzed['AI Experience']
+                )
+            ]
             
             if not candidates:
                 print("❌ No candidates with video analysis found")
@@ -319,12 +433,20 @@ class FixedStudentSelectionCrew:
             final_candidates = self.finalizer.select_final_candidates(candidates)
             
             # Update final results in sheet
-            for i, candidate in enumerate(final_candidates, 2):
-                # Find the candidate in the sheet and update final result
-                for j, row in enumerate(student_data[1:], 2):
-                    if len(row) >= 1 and row[0] == candidate['student_name']:
-                        self.sheets_manager.update_cell('Sheet1', f'I{j}', 'Selected')
-                        break
+            named = df[df['Student Name'] != '']
+            name_to_row = dict(zip(named['Student Name'], named.index))
+            selected_rows = [
+                name_to_row[candidate['student_name']]
+                for candidate in final_candidates
+                if candidate['student_name'] in name_to_row
+            ]
+            
+            # Rewrite column I in one range, keeping other students' result
+            final_result = df['Final Result'].copy()
+            final_result[selected_rows] = 'Selected'
+            self.sheets_manager.batch_update(
+                'Sheet1', [(f'I2:I{len(final_result) + 1}', [[value] for value in final_result])]
+            )
             
             # Send final notifications
             email_results = self.finalizer.send_final_selection_notifications(final_candidates)
@@ -347,9 +469,9 @@ class FixedStudentSelectionCrew:
         """
         try:
             # Get data from your sheet
-            student_data = self.sheets_manager.read_sheet('Sheet1', 'A:I')
+            df = self._load_students()
             
-            if not student_data or len(student_data) < 2:
+            if df.empty:
                 return {
                     'quiz_questions': 0,
                     'quiz_results': 0,
@@ -358,22 +480,11 @@ class FixedStudentSelectionCrew:
                     'final_selection': 0
                 }
             
-            # Count different statuses
-            quiz_results = 0
-            shortlisted = 0
-            video_analysis = 0
-            final_selection = 0
-            
-            for row in student_data[1:]:  # Skip header
-                if len(row) >= 4:
-                    if row[2] and str(row[2]).replace('.', '').isdigit():  # Has quiz marks
-                        quiz_results += 1
-                    if row[3] == 'Shortlisted':  # Shortlisted
-                        shortlisted += 1
-                    if row[6] and str(row[6]).replace('.', '').isdigit():  # Has confidence score
-                        video_analysis += 1
-                    if row[8] == 'Selected':  # Final selection
-                        final_selection += 1
+            # Count different statuses in one vectorized pass
+            quiz_results = int(df['Quiz Marks'].notna().sum())
+            shortlisted = int((df['Status'] == 'Shortlisted').sum())
+            video_analysis = int(df['Confidence'].notna().sum())
+            final_selection = int((df['Final Result'] == 'Selected').sum())
             
             return {
                 'quiz_questions': 1,  # We have quiz questions stored
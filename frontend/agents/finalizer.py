@@ -2,6 +2,7 @@
 Agent 5: Finalizer
 Handles final top 5 selection based on video analysis
 """
+from operator import itemgetter
 from crewai import Agent, Task
 from typing import List, Dict, Any
 import pandas as pd
@@ -9,6 +10,12 @@ from tools.sheets_manager import SheetsManager
 from tools.email_manager import EmailManager
 from config import Config
 
+# Comprehensive score bonus by education status
+_EDU_BONUS = {'graduated': 1.5, 'final year': 1.0}
+
+# Sort key for ranking candidates by comprehensive score
+_score_key = itemgetter('comprehensive_score')
+
 class FinalizerAgent:
     def __init__(self, sheets_manager: SheetsManager, email_manager: EmailManager):
         """
@@ -95,20 +102,14 @@ class FinalizerAgent:
             )
             
             # Education bonus
-            education_bonus = 0
-            if result['education_status'] == 'graduated':
-                education_bonus = 1.5
-            elif result['education_status'] == 'final year':
-                education_bonus = 1.0
+            education_bonus = _EDU_BONUS.get(result['education_status'], 0)
             
             # Final comprehensive score
             result['comprehensive_score'] = base_score + education_bonus
             result['education_bonus'] = education_bonus
         
         # Sort by comprehensive score (descending)
-        sorted_results = sorted(successful_results, 
-                              key=lambda x: x['comprehensive_score'], 
-                              reverse=True)
+        sorted_results = sorted(successful_results, key=_score_key, reverse=True)
         
         # Select top candidates
         final_candidates = sorted_results[:limit]
@@ -2,6 +2,8 @@
 Agent 3: Shortlist Agent
 Handles top 10 student selection and email notifications
 """
+import heapq
+from operator import itemgetter
 from crewai import Agent, Task
 from typing import List, Dict, Any
 import pandas as pd
@@ -71,14 +73,12 @@ class ShortlistAgent:
         if not quiz_results:
             return []
         
-        # Sort by percentage (descending)
-        sorted_results = sorted(quiz_results, key=lambda x: x['percentage'], reverse=True)
-        
         # Apply limit
         if limit is None:
             limit = Config.MAX_SHORTLIST
         
-        shortlisted = sorted_results[:limit]
+        # Select top students by percentage (descending) without a full sort
+        shortlisted = heapq.nlargest(limit, quiz_results, key=itemgetter('percentage'))
         
         # Add shortlist metadata
         for student in shortlisted:
@@ -9,6 +9,12 @@ from tools.sheets_manager import SheetsManager
 from tools.video_analyzer import VideoAnalyzer
 from config import Config
 
+# Result keys of the Video_Analysis columns, in sheet order
+VIDEO_ANALYSIS_COLUMNS = [
+    'student_id', 'video_path', 'transcript', 'confidence_score', 'ai_experience_score',
+    'education_status', 'communication_score', 'detailed_analysis', 'analysis_timestamp', 'success'
+]
+
 class VideoAnalyzerAgent:
     def __init__(self, sheets_manager: SheetsManager, video_analyzer: VideoAnalyzer):
         """
@@ -170,25 +176,15 @@ class VideoAnalyzerAgent:
                 return []
             
             headers = data[0]
-            results = []
+            rows = [row[:len(VIDEO_ANALYSIS_COLUMNS)] for row in data[1:] if len(row) >= len(headers)]
+            df = pd.DataFrame(rows, columns=VIDEO_ANALYSIS_COLUMNS)
             
-            for row in data[1:]:
-                if len(row) >= len(headers):
-                    result = {
-                        'student_id': row[0],
-                        'video_path': row[1],
-                        'transcript': row[2],
-                        'confidence_score': float(row[3]) if row[3] else 0,
-                        'ai_experience_score': float(row[4]) if row[4] else 0,
-                        'education_status': row[5],
-                        'communication_score': float(row[6]) if row[6] else 0,
-                        'detailed_analysis': row[7],
-                        'analysis_timestamp': row[8],
-                        'success': row[9].lower() == 'true' if row[9] else False
-                    }
-                    results.append(result)
+            # Parse each score column in one pass; blank or malformed cells become 0.0
+            for column in ('confidence_score', 'ai_experience_score', 'communication_score'):
+                df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0.0).astype(float)
+            df['success'] = df['success'].str.lower().eq('true')
             
-            return results
+            return df.to_dict('records')
             
         except Exception as e:
             print(f"Error retrieving video analysis results: {e}")
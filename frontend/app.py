@@ -3,19 +3,73 @@ Student Selection Crew - Interactive Web Interface
 A beautiful and functional frontend for your multi-agent system
 """
 import streamlit as st
+import asyncio
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import io
 import json
 import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Import our modules from current directory
 from fixed_student_selection_crew import FixedStudentSelectionCrew
 from config import Config
-import tempfile
 import time
 
+# Whisper rejects uploads over 25 MB; larger videos are split into audio chunks
+WHISPER_UPLOAD_LIMIT = 24 * 1024 * 1024
+AUDIO_CHUNK_SECONDS = 60
+WHISPER_WORKERS = 4
+# Transcripts scored at once; keeps concurrent GPT-4 requests under the rate limit
+OPENAI_CONCURRENCY = 4
+
+def split_audio_chunks(video_data, chunk_seconds=AUDIO_CHUNK_SECONDS):
+    """
+    Extract the audio track with ffmpeg and split it into in-memory mp3 chunks
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = os.path.join(temp_dir, "video.mp4")
+        with open(video_path, "wb") as video_file:
+            video_file.write(video_data)
+        
+        subprocess.run([
+            'ffmpeg', '-i', video_path, '-vn', '-ac', '1', '-ar', '16000', '-b:a', '64k',
+            '-f', 'segment', '-segment_time', str(chunk_seconds),
+            os.path.join(temp_dir, 'chunk_%04d.mp3')
+        ], check=True, capture_output=True)
+        
+        chunks = []
+        for chunk_name in sorted(f for f in os.listdir(temp_dir) if f.startswith('chunk_')):
+            with open(os.path.join(temp_dir, chunk_name), "rb") as chunk_file:
+                chunk = io.BytesIO(chunk_file.read())
+            chunk.name = chunk_name
+            chunks.append(chunk)
+        return chunks
+
+def transcribe_chunks(client, chunks):
+    """
+    Transcribe audio chunks concurrently and join the text in order
+    """
+    def transcribe(chunk):
+        return client.audio.transcriptions.create(
+            model="whisper-1",
+            file=chunk,
+            response_format="text"
+        )
+    
+    with ThreadPoolExecutor(max_workers=min(len(chunks), WHISPER_WORKERS) or 1) as executor:
+        parts = list(executor.map(transcribe, chunks))
+    return "\n".join(part.strip() for part in parts)
+
 # AI Video Analysis Functions
 def extract_audio_and_transcribe(video_data, student_name):
     """
@@ -23,7 +77,7 @@ def extract_audio_and_transcribe(video_data, student_name):
     """
     try:
         # Check if OpenAI API key is available
-        if not hasattr(Config, 'OPENAI_API_KEY') or not Config.OPENAI_API_KEY or Config.OPENAI_API_KEY == "your_openai_api_key_here":
+        if not has_openai_key():
             # Fallback to enhanced simulation if no API key
             time.sleep(2)  # Simulate processing time
             
@@ -68,27 +122,25 @@ Interviewer: "Thank you for your time today. We'll be in touch soon."
         
         # Real OpenAI Whisper API implementation
         try:
-            import openai
             from openai import OpenAI
             
             client = OpenAI(api_key=Config.OPENAI_API_KEY)
             
-            # Save video data to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
-                temp_file.write(video_data)
-                temp_file_path = temp_file.name
-            
-            # Extract audio using OpenAI Whisper
-            with open(temp_file_path, "rb") as audio_file:
+            if len(video_data) > WHISPER_UPLOAD_LIMIT:
+                # Long interviews: transcribe audio chunks in parallel
+                transcript_response = transcribe_chunks(client, split_audio_chunks(video_data))
+            else:
+                # Upload straight from memory; the name tells Whisper the container format
+                audio_file = io.BytesIO(video_data)
+                audio_file.name = "video.mp4"
+                
+                # Extract audio using OpenAI Whisper
                 transcript_response = client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
                     response_format="text"
                 )
             
-            # Clean up temporary file
-            os.unlink(temp_file_path)
-            
             # Format the real transcript
             real_transcript = f"""
 [REAL AI TRANSCRIPTION - OpenAI Whisper]
@@ -111,56 +163,36 @@ Video size: {len(video_data)} bytes
     except Exception as e:
         raise Exception(f"Audio extraction failed: {e}")
 
-def analyze_transcript_with_ai(transcript, student_name):
+def keyword_pattern(keywords):
+    """Compile one case-insensitive alternation matching any of the keywords, longest first"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=lambda k: (-len(k), k))), re.IGNORECASE)
+
+def count_keywords(text, pattern):
+    """Count keyword occurrences in text with a single regex scan"""
+    return sum(1 for _ in pattern.finditer(text))
+
+# Keywords scored by the simulated transcript analysis, compiled once at import
+CONFIDENCE_WORDS = frozenset({'confident', 'believe', 'strong', 'excited', 'passionate', 'eager', 'enthusiastic', 'determined'})
+COMMUNICATION_WORDS = frozenset({'clear', 'understand', 'explain', 'discuss', 'communicate', 'articulate', 'describe', 'elaborate'})
+TECHNICAL_TERMS = frozenset({
+    'ai', 'artificial intelligence', 'machine learning', 'neural network', 'algorithm',
+    'data science', 'programming', 'python', 'model', 'analytics', 'computer vision',
+    'natural language processing', 'deep learning', 'tensorflow', 'bert', 'preprocessing',
+    'tokenization', 'sentiment analysis', 'classification', 'research', 'framework'
+})
+CONFIDENCE_PATTERN = keyword_pattern(CONFIDENCE_WORDS)
+COMMUNICATION_PATTERN = keyword_pattern(COMMUNICATION_WORDS)
+TECHNICAL_PATTERN = keyword_pattern(TECHNICAL_TERMS)
+
+# Faster and cheaper than gpt-4 for rubric scoring; JSON mode guarantees a parseable reply
+ANALYSIS_MODEL = "gpt-4o-mini"
+
+def analysis_request(transcript, student_name):
     """
-    Analyze transcript using AI to generate scores for different criteria
+    Build the chat completion arguments for scoring one transcript
     """
-    try:
-        # Check if OpenAI API key is available for GPT-4 analysis
-        if not hasattr(Config, 'OPENAI_API_KEY') or not Config.OPENAI_API_KEY or Config.OPENAI_API_KEY == "your_openai_api_key_here":
-            # Enhanced simulation with intelligent content analysis
-            time.sleep(1)  # Simulate processing time
-            
-            # Advanced analysis based on transcript content
-            transcript_lower = transcript.lower()
-            word_count = len(transcript.split())
-            
-            # Analyze confidence indicators
-            confidence_indicators = ['confident', 'believe', 'strong', 'excited', 'passionate', 'eager', 'enthusiastic', 'determined']
-            confidence_count = sum(transcript_lower.count(word) for word in confidence_indicators)
-            confidence_score = min(10.0, 6.0 + confidence_count * 0.5 + (word_count / 100))
-            
-            # Analyze communication quality
-            communication_indicators = ['clear', 'understand', 'explain', 'discuss', 'communicate', 'articulate', 'describe', 'elaborate']
-            communication_count = sum(transcript_lower.count(word) for word in communication_indicators)
-            communication_score = min(10.0, 6.5 + communication_count * 0.4 + (len(transcript) / 300))
-            
-            # Analyze technical knowledge
-            technical_terms = ['ai', 'artificial intelligence', 'machine learning', 'neural network', 'algorithm', 
-                              'data science', 'programming', 'python', 'model', 'analytics', 'computer vision', 
-                              'natural language processing', 'deep learning', 'tensorflow', 'bert', 'preprocessing',
-                              'tokenization', 'sentiment analysis', 'classification', 'research', 'framework']
-            technical_count = sum(transcript_lower.count(term) for term in technical_terms)
-            technical_score = min(10.0, 5.5 + technical_count * 0.3)
-            
-            # Calculate overall score
-            overall_score = (confidence_score + communication_score + technical_score) / 3
-            
-            return {
-                'confidence': round(confidence_score, 1),
-                'communication': round(communication_score, 1), 
-                'technical': round(technical_score, 1),
-                'overall': round(overall_score, 1)
-            }
-        
-        # Real GPT-4 analysis implementation
-        try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=Config.OPENAI_API_KEY)
-            
-            # Create detailed analysis prompt
-            analysis_prompt = f"""
+    # Create detailed analysis prompt
+    analysis_prompt = f"""
 You are an expert HR interviewer and AI technical assessor. Analyze this interview transcript for {student_name} and provide detailed scoring.
 
 TRANSCRIPT:
@@ -196,30 +228,81 @@ Respond in this exact JSON format:
     "overall": X.X,
     "analysis": "Brief 2-3 sentence summary of the candidate's performance"
 }}
-            """
+    """
+    
+    return {
+        "model": ANALYSIS_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert interview assessor. Provide accurate, fair, and detailed candidate evaluations. Respond with a single JSON object."},
+            {"role": "user", "content": analysis_prompt}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+        "max_tokens": 500
+    }
+
+def parse_analysis_content(content):
+    """
+    Parse the JSON scores returned by the analysis model
+    """
+    analysis_result = _loads(content)
+    
+    return {
+        'confidence': float(analysis_result['confidence']),
+        'communication': float(analysis_result['communication']),
+        'technical': float(analysis_result['technical']),
+        'overall': float(analysis_result['overall']),
+        'ai_analysis': analysis_result.get('analysis', 'AI analysis completed successfully')
+    }
+
+def has_openai_key():
+    """Whether a real OpenAI API key is configured"""
+    return bool(getattr(Config, 'OPENAI_API_KEY', None)) and Config.OPENAI_API_KEY != "your_openai_api_key_here"
+
+def analyze_transcript_with_ai(transcript, student_name):
+    """
+    Analyze transcript using AI to generate scores for different criteria
+    """
+    try:
+        # Check if OpenAI API key is available for GPT-4 analysis
+        if not has_openai_key():
+            # Enhanced simulation with intelligent content analysis
+            time.sleep(1)  # Simulate processing time
             
-            # Get GPT-4 analysis
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert interview assessor. Provide accurate, fair, and detailed candidate evaluations."},
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
+            # Advanced analysis based on transcript content
+            word_count = len(transcript.split())
             
-            # Parse the JSON response
-            import json
-            analysis_result = json.loads(response.choices[0].message.content)
+            # Analyze confidence indicators
+            confidence_count = count_keywords(transcript, CONFIDENCE_PATTERN)
+            confidence_score = min(10.0, 6.0 + confidence_count * 0.5 + (word_count / 100))
+            
+            # Analyze communication quality
+            communication_count = count_keywords(transcript, COMMUNICATION_PATTERN)
+            communication_score = min(10.0, 6.5 + communication_count * 0.4 + (len(transcript) / 300))
+            
+            # Analyze technical knowledge
+            technical_count = count_keywords(transcript, TECHNICAL_PATTERN)
+            technical_score = min(10.0, 5.5 + technical_count * 0.3)
+            
+            # Calculate overall score
+            overall_score = (confidence_score + communication_score + technical_score) / 3
             
             return {
-                'confidence': float(analysis_result['confidence']),
-                'communication': float(analysis_result['communication']),
-                'technical': float(analysis_result['technical']),
-                'overall': float(analysis_result['overall']),
-                'ai_analysis': analysis_result.get('analysis', 'AI analysis completed successfully')
+                'confidence': round(confidence_score, 1),
+                'communication': round(communication_score, 1), 
+                'technical': round(technical_score, 1),
+                'overall': round(overall_score, 1)
             }
+        
+        # Real GPT-4 analysis implementation
+        try:
+            from openai import OpenAI
+            
+            client = OpenAI(api_key=Config.OPENAI_API_KEY)
+            
+            # Get GPT-4 analysis
+            response = client.chat.completions.create(**analysis_request(transcript, student_name))
+            return parse_analysis_content(response.choices[0].message.content)
             
         except Exception as api_error:
             # Fallback to enhanced simulation if GPT-4 fails
@@ -228,6 +311,47 @@ Respond in this exact JSON format:
     except Exception as e:
         raise Exception(f"AI analysis failed: {e}")
 
+async def _analyze_transcript_async(client, transcript, student_name):
+    """
+    Score one transcript with the async OpenAI client
+    """
+    try:
+        response = await client.chat.completions.create(**analysis_request(transcript, student_name))
+        return parse_analysis_content(response.choices[0].message.content)
+    except Exception as e:
+        raise Exception(f"AI analysis failed: GPT-4 analysis failed: {e}")
+
+async def analyze_transcripts_concurrently(items):
+    """
+    Score several (transcript, student_name) pairs at once
+    
+    GPT-4 requests are issued together with AsyncOpenAI instead of one after
+    another, at most OPENAI_CONCURRENCY at a time; failures are returned in
+    place of the scores for that student.
+    """
+    semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+    
+    async def bounded(call):
+        async with semaphore:
+            return await call
+    
+    if not has_openai_key():
+        return await asyncio.gather(
+            *(bounded(asyncio.to_thread(analyze_transcript_with_ai, transcript, name)) for transcript, name in items),
+            return_exceptions=True
+        )
+    
+    from openai import AsyncOpenAI
+    
+    client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+    try:
+        return await asyncio.gather(
+            *(bounded(_analyze_transcript_async(client, transcript, name)) for transcript, name in items),
+            return_exceptions=True
+        )
+    finally:
+        await client.close()
+
 # Page configuration
 st.set_page_config(
     page_title="Student Selection Crew",
@@ -237,7 +361,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -299,14 +423,16 @@ st.markdown("""
         color: white;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Collapse the stylesheet once at import; it has to be re-sent on every rerun,
+# since Streamlit drops elements a run does not emit, so keep the payload small
+APP_CSS = re.sub(r'\s*([{}:;,>])\s*', r'\1', re.sub(r'\s+', ' ', APP_CSS)).strip()
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'crew_initialized' not in st.session_state:
-        st.session_state.crew_initialized = False
-    if 'crew' not in st.session_state:
-        st.session_state.crew = None
     if 'quiz_questions' not in st.session_state:
         st.session_state.quiz_questions = []
     if 'student_answers' not in st.session_state:
@@ -316,20 +442,35 @@ def initialize_session_state():
     if 'editing_question' not in st.session_state:
         st.session_state.editing_question = None
 
+# Sheets shown on the dashboard, fetched together in one batchGet
+DASHBOARD_SHEETS = ('Quiz_Questions', 'Students')
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _read_sheets_cached(ranges):
+    """Read several sheets in one request, reusing the result for 30 seconds across reruns"""
+    return _get_crew().sheets_manager.read_sheets(list(ranges))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_quiz_questions(_crew):
+    """Read the Quiz_Questions sheet, reused across reruns until the questions are saved again"""
+    return _crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+
+def _get_crew():
+    """Build the crew once per session; its Google API client is not thread-safe, so sessions don't share it"""
+    if st.session_state.get('crew') is None:
+        with st.spinner("Initializing Student Selection Crew..."):
+            st.session_state.crew = FixedStudentSelectionCrew(
+                credentials_file="studentcrew-473406-c69f4c709523.json",
+                sheet_id=Config.GOOGLE_SHEET_ID,
+                gmail_username=Config.GMAIL_USERNAME,
+                gmail_password=Config.GMAIL_APP_PASSWORD
+            )
+    return st.session_state.crew
+
 def initialize_crew():
     """Initialize the Student Selection Crew"""
     try:
-        if not st.session_state.crew_initialized:
-            with st.spinner("Initializing Student Selection Crew..."):
-                st.session_state.crew = FixedStudentSelectionCrew(
-                    credentials_file="studentcrew-473406-c69f4c709523.json",
-                    sheet_id=Config.GOOGLE_SHEET_ID,
-                    gmail_username=Config.GMAIL_USERNAME,
-                    gmail_password=Config.GMAIL_APP_PASSWORD
-                )
-                st.session_state.crew_initialized = True
-                st.success("✅ Student Selection Crew initialized successfully!")
-        return st.session_state.crew
+        return _get_crew()
     except Exception as e:
         st.error(f"❌ Failed to initialize crew: {e}")
         return None
@@ -361,10 +502,11 @@ def display_sidebar():
     # Quick Actions
     st.sidebar.title("🚀 Quick Actions")
     if st.sidebar.button("🔄 Refresh System"):
-        st.session_state.crew_initialized = False
+        st.session_state.crew = None
         st.rerun()
     
     if st.sidebar.button("📊 Refresh Status"):
+        st.cache_data.clear()
         st.rerun()
     
     if st.sidebar.button("📊 View Google Sheet"):
@@ -372,36 +514,55 @@ def display_sidebar():
     
     return page
 
+@st.cache_data(show_spinner=False)
+def _overview_figure(quiz_count, students_count, shortlisted_count, final_selection_count):
+    """Build the System Overview bar chart, reused across reruns while the counts are unchanged"""
+    import plotly.graph_objects as go
+    
+    # Create a simple progress chart
+    categories = ['Quiz Questions', 'Students', 'Shortlisted', 'Final Selection']
+    values = [quiz_count, students_count, shortlisted_count, final_selection_count]
+    colors = ['#667eea', '#f5576c', '#4facfe', '#43e97b']
+    
+    fig = go.Figure(data=go.Bar(
+        x=categories,
+        y=values,
+        marker_color=colors,
+        text=values,
+        textposition='auto',
+    ))
+    
+    fig.update_layout(
+        title="System Overview",
+        height=300,
+        showlegend=False,
+        xaxis_tickangle=-45,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
 def dashboard_page():
     """Display the main dashboard with real data"""
     st.title("🏠 Dashboard")
     
-    # Initialize crew to get real data
-    crew = initialize_crew()
-    
-    # Get real data from Google Sheets
+    # Get real data from Google Sheets; the cached reader builds the shared crew on first use
     try:
+        sheets_data = _read_sheets_cached(DASHBOARD_SHEETS)
+        
         # Get quiz questions count
-        quiz_questions = crew.sheets_manager.read_sheet('Quiz_Questions')
+        quiz_questions = sheets_data.get('Quiz_Questions', [])
         quiz_count = len(quiz_questions) - 1 if quiz_questions and len(quiz_questions) > 1 else 0
         
         # Get students count
-        students_data = crew.sheets_manager.read_sheet('Students')
+        students_data = sheets_data.get('Students', [])
         students_count = len(students_data) - 1 if students_data and len(students_data) > 1 else 0
         
-        # Get shortlisted count
-        shortlisted_count = 0
-        if students_data and len(students_data) > 1:
-            for row in students_data[1:]:  # Skip header
-                if len(row) > 4 and 'Shortlisted' in str(row[4]):
-                    shortlisted_count += 1
-        
-        # Get final selection count
-        final_selection_count = 0
-        if students_data and len(students_data) > 1:
-            for row in students_data[1:]:  # Skip header
-                if len(row) > 4 and 'Selected' in str(row[4]):
-                    final_selection_count += 1
+        # Tally shortlisted and final selection counts with vectorized matches on the status column
+        students_df = pd.DataFrame(students_data[1:])
+        status = students_df[4].dropna().astype(str) if students_df.shape[1] > 4 else pd.Series(dtype=str)
+        shortlisted_count = int(status.str.contains('Shortlisted', regex=False).sum())
+        final_selection_count = int(status.str.contains('Selected', regex=False).sum())
                     
     except Exception as e:
         st.error(f"Error loading data: {e}")
@@ -413,28 +574,17 @@ def dashboard_page():
     # Key Metrics with improved styling
     st.subheader("📊 Key Metrics")
     
-    col1, col2, col3, col4 = st.columns(4)
+    metric_cards = [
+        ("📝 Quiz Questions", quiz_count, "#667eea 0%, #764ba2 100%"),
+        ("👥 Students", students_count, "#f093fb 0%, #f5576c 100%"),
+        ("🏆 Shortlisted", shortlisted_count, "#4facfe 0%, #00f2fe 100%"),
+        ("🎯 Final Selection", final_selection_count, "#43e97b 0%, #38f9d7 100%"),
+    ]
     
-    with col1:
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            border-radius: 15px;
-            color: white;
-            text-align: center;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        ">
-            <h3 style="margin: 0; font-size: 14px; opacity: 0.9;">📝 Quiz Questions</h3>
-            <h2 style="margin: 10px 0 0 0; font-size: 32px; font-weight: bold;">{quiz_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
+    # All four cards go out as one markdown element laid out by a CSS grid
+    cards_html = "".join(f"""
         <div style="
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            background: linear-gradient(135deg, {gradient});
             padding: 20px;
             border-radius: 15px;
             color: white;
@@ -442,42 +592,14 @@ def dashboard_page():
             box-shadow: 0 4px 15px rgba(0,0,0,0.1);
             margin-bottom: 20px;
         ">
-            <h3 style="margin: 0; font-size: 14px; opacity: 0.9;">👥 Students</h3>
-            <h2 style="margin: 10px 0 0 0; font-size: 32px; font-weight: bold;">{students_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+            <h3 style="margin: 0; font-size: 14px; opacity: 0.9;">{label}</h3>
+            <h2 style="margin: 10px 0 0 0; font-size: 32px; font-weight: bold;">{value}</h2>
+        </div>""" for label, value, gradient in metric_cards)
     
-    with col3:
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            padding: 20px;
-            border-radius: 15px;
-            color: white;
-            text-align: center;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        ">
-            <h3 style="margin: 0; font-size: 14px; opacity: 0.9;">🏆 Shortlisted</h3>
-            <h2 style="margin: 10px 0 0 0; font-size: 32px; font-weight: bold;">{shortlisted_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);
-            padding: 20px;
-            border-radius: 15px;
-            color: white;
-            text-align: center;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        ">
-            <h3 style="margin: 0; font-size: 14px; opacity: 0.9;">🎯 Final Selection</h3>
-            <h2 style="margin: 10px 0 0 0; font-size: 32px; font-weight: bold;">{final_selection_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(f"""
+    <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px;">{cards_html}
+    </div>
+    """, unsafe_allow_html=True)
     
     # Recent Activity with real data
     st.subheader("📈 Recent Activity")
@@ -537,8 +659,8 @@ def dashboard_page():
         system_status = []
         
         try:
-            # Test Google Sheets connection
-            crew.sheets_manager.read_sheet('Students')
+            # Test Google Sheets connection with a live read, bypassing the dashboard cache
+            _get_crew().sheets_manager.read_sheet('Students', 'A1:A1')
             system_status.append("✅ Google Sheets: Connected")
         except:
             system_status.append("❌ Google Sheets: Error")
@@ -575,28 +697,7 @@ def dashboard_page():
     with col2:
         # Dynamic chart based on real data
         if students_count > 0:
-            # Create a simple progress chart
-            categories = ['Quiz Questions', 'Students', 'Shortlisted', 'Final Selection']
-            values = [quiz_count, students_count, shortlisted_count, final_selection_count]
-            colors = ['#667eea', '#f5576c', '#4facfe', '#43e97b']
-            
-            fig = go.Figure(data=go.Bar(
-                x=categories,
-                y=values,
-                marker_color=colors,
-                text=values,
-                textposition='auto',
-            ))
-            
-            fig.update_layout(
-                title="System Overview",
-                height=300,
-                showlegend=False,
-                xaxis_tickangle=-45,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-            
+            fig = _overview_figure(quiz_count, students_count, shortlisted_count, final_selection_count)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("📊 No data available for visualization yet. Start by creating quiz questions and evaluating students!")
@@ -786,6 +887,7 @@ def quiz_manager_page():
     if st.session_state.quiz_questions and st.button("💾 Save Questions to System"):
         with st.spinner("Saving questions..."):
             success = crew.create_quiz_questions(st.session_state.quiz_questions)
+            _load_quiz_questions.clear()
             if success:
                 st.success("✅ Questions saved to Google Sheets!")
             else:
@@ -793,6 +895,7 @@ def quiz_manager_page():
 
 def student_evaluation_page():
     """Display student evaluation page"""
+    import plotly.express as px
     st.title("📊 Student Evaluation")
     
     crew = initialize_crew()
@@ -803,11 +906,11 @@ def student_evaluation_page():
     try:
         # Try to get quiz questions from the system
         try:
-            quiz_data = crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+            quiz_data = _load_quiz_questions(crew)
         except Exception as e:
             st.warning("⚠️ Quiz_Questions section not found. Creating it now...")
             crew._create_quiz_questions_sheet()
-            quiz_data = crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+            quiz_data = _load_quiz_questions(crew)
         
         if quiz_data and len(quiz_data) > 1:
             st.success(f"✅ Found {len(quiz_data)-1} quiz questions in the system!")
@@ -985,8 +1088,7 @@ def student_evaluation_page():
                             
                             # Calculate quiz score
                             try:
-                                # Get quiz questions to calculate score
-                                quiz_data = crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+                                # Score against the quiz questions loaded for this page
                                 if quiz_data and len(quiz_data) > 1:
                                     correct_answers = 0
                                     total_questions = len(quiz_data) - 1
@@ -1022,6 +1124,7 @@ def student_evaluation_page():
                                                 
                                                 # Write back to sheet
                                                 crew.sheets_manager.write_sheet('Students', [updated_row], f'A{i}')
+                                                _read_sheets_cached.clear()
                                                 st.success("✅ Quiz score saved to Google Sheets!")
                                                 break
                                 except Exception as e:
@@ -1061,14 +1164,14 @@ def student_evaluation_page():
                     existing_data = crew.sheets_manager.read_sheet('Students', 'A:K')
                     next_row = len(existing_data) + 1 if existing_data else 2
                     
-                    # Save each student
+                    # Build every student's row, then write them all in one request
+                    rows = []
                     for i, student in enumerate(st.session_state.student_answers):
                         # Calculate quiz score if not already calculated
                         quiz_score = student.get('quiz_score', '')
                         if not quiz_score and student.get('answers'):
                             try:
-                                # Get quiz questions to calculate score
-                                quiz_data = crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+                                # Score against the quiz questions loaded for this page
                                 if quiz_data and len(quiz_data) > 1:
                                     correct_answers = 0
                                     total_questions = len(quiz_data) - 1
@@ -1104,8 +1207,10 @@ def student_evaluation_page():
                             '',  # AI Experience
                             ''   # Final Result
                         ]
-                        
-                        crew.sheets_manager.write_sheet('Students', [student_data], f'A{next_row + i}')
+                        rows.append(student_data)
+                    
+                    crew.sheets_manager.write_sheet('Students', rows, f'A{next_row}')
+                    _read_sheets_cached.clear()
                     
                     st.success(f"✅ Saved {len(st.session_state.student_answers)} students to Google Sheets!")
                 except Exception as e:
@@ -1182,6 +1287,7 @@ def student_evaluation_page():
 
 def shortlisting_page():
     """Display shortlisting page"""
+    import plotly.express as px
     st.title("🏆 Student Shortlisting")
     
     crew = initialize_crew()
@@ -1295,6 +1401,7 @@ def shortlisting_page():
 
 def video_analysis_page():
     """Display video analysis page"""
+    import plotly.express as px
     st.title("🎥 Video Analysis")
     
     crew = initialize_crew()
@@ -1544,7 +1651,7 @@ def video_analysis_page():
         - **Azure Cognitive Services** - `pip install azure-cognitiveservices-speech`
         
         #### 🧠 **AI Analysis Services:**
-        - **OpenAI GPT-4** - For intelligent transcript analysis
+        - **OpenAI GPT-4o mini** - For intelligent transcript analysis
         - **Anthropic Claude** - For detailed performance evaluation
         - **Google Gemini** - For comprehensive scoring
         
@@ -1558,7 +1665,7 @@ def video_analysis_page():
         - ✅ **Video Upload System** - Fully functional
         - ✅ **Student Linking** - Videos properly linked to students  
         - ✅ **OpenAI Whisper Integration** - Ready for real speech-to-text
-        - ✅ **GPT-4 Analysis Integration** - Ready for intelligent scoring
+        - ✅ **GPT-4o mini Analysis Integration** - Ready for intelligent scoring
         - ✅ **Results Display** - Complete analysis dashboard
         - ⚠️ **API Key Required** - Add OPENAI_API_KEY to .env file to activate
         
@@ -1588,21 +1695,33 @@ def video_analysis_page():
                 
                 st.info(f"🎬 Analyzing {len(uploaded_videos)} uploaded videos...")
                 
+                # Step 1: Extract audio and convert to text using AI
+                transcripts = {}
+                for student_id, video_info in uploaded_videos.items():
+                    st.info(f"🎤 Processing audio from {video_info['file_name']}...")
+                    try:
+                        transcripts[student_id] = extract_audio_and_transcribe(video_info['file_data'], video_info['student_name'])
+                    except Exception as e:
+                        transcripts[student_id] = e
+                
+                # Step 2: Analyze all transcripts concurrently for scoring
+                pending = [sid for sid, transcript in transcripts.items() if isinstance(transcript, str)]
+                scores = asyncio.run(analyze_transcripts_concurrently(
+                    [(transcripts[sid], uploaded_videos[sid]['student_name']) for sid in pending]
+                ))
+                analyses = dict(zip(pending, scores))
+                
                 # Process each uploaded video
                 for student_id, video_info in uploaded_videos.items():
                     student_name = video_info['student_name']
                     file_name = video_info['file_name']
                     file_size = video_info['file_size']
                     
-                    # Real AI video analysis using speech-to-text and AI evaluation
-                    st.info(f"🎤 Processing audio from {file_name}...")
-                    
                     try:
-                        # Step 1: Extract audio and convert to text using AI
-                        transcript = extract_audio_and_transcribe(video_info['file_data'], student_name)
-                        
-                        # Step 2: Analyze transcript using AI for scoring
-                        analysis_scores = analyze_transcript_with_ai(transcript, student_name)
+                        transcript = transcripts[student_id]
+                        analysis_scores = analyses.get(student_id, transcript)
+                        if isinstance(analysis_scores, Exception):
+                            raise analysis_scores
                         
                         confidence_score = analysis_scores['confidence']
                         communication_score = analysis_scores['communication']
@@ -1884,6 +2003,7 @@ def video_analysis_page():
 
 def final_selection_page():
     """Display final selection page"""
+    import plotly.express as px
     st.title("🎯 Final Selection")
     
     crew = initialize_crew()
@@ -1984,10 +2104,11 @@ def get_analytics_data():
         if not crew:
             return None
             
-        # Get data from all sheets
-        students_data = crew.sheets_manager.read_sheet('Students', 'A:K')
-        shortlisted_data = crew.sheets_manager.read_sheet('Shortlisted_Students', 'A:K')
-        quiz_data = crew.sheets_manager.read_sheet('Quiz_Questions', 'A:J')
+        # Get data from all sheets in a single batchGet
+        sheets_data = crew.sheets_manager.read_sheets(['Students!A:K', 'Shortlisted_Students!A:K', 'Quiz_Questions!A:J'])
+        students_data = sheets_data.get('Students!A:K', [])
+        shortlisted_data = sheets_data.get('Shortlisted_Students!A:K', [])
+        quiz_data = sheets_data.get('Quiz_Questions!A:J', [])
         
         analytics = {
             'total_students': len(students_data) - 1 if students_data else 0,  # -1 for header
@@ -2059,6 +2180,8 @@ def get_analytics_data():
 
 def analytics_page():
     """Display analytics page with real data"""
+    import plotly.express as px
+    import plotly.graph_objects as go
     st.title("📈 Analytics & Reports")
     
     # Load real analytics data
@@ -2245,7 +2368,7 @@ def settings_page():
     
     with col1:
         if st.button("🔄 Refresh System"):
-            st.session_state.crew_initialized = False
+            st.session_state.crew = None
             st.rerun()
     
     with col2:
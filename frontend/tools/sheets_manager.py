@@ -51,6 +51,26 @@ class SheetsManager:
         
         return result.get('values', [])
     
+    def read_sheets(self, ranges: List[str]) -> Dict[str, List[List[str]]]:
+        """
+        Read several sheets or ranges in a single API request
+        
+        Args:
+            ranges: Sheet names or A1 ranges (e.g., ['Students', 'Quiz_Questions!A:J'])
+        
+        Returns:
+            Dictionary mapping each requested range to its rows
+        """
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.sheet_id,
+            ranges=ranges
+        ).execute()
+        
+        return {
+            range_name: value_range.get('values', [])
+            for range_name, value_range in zip(ranges, result.get('valueRanges', []))
+        }
+    
     def write_sheet(self, sheet_name: str, data: List[List[str]], 
                    start_cell: str = 'A1') -> None:
         """
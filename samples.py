@@ -0,0 +1,89 @@
+"""
+Sample quiz, submission and video data shared by the demo scripts
+"""
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Interned so student_id keys compare by identity downstream
+_STUDENT_IDS = tuple(sys.intern(f"STU{i:03d}") for i in range(1, 6))
+
+SAMPLE_QUIZ_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'sample_quiz.json')
+
+@lru_cache(maxsize=1)
+def sample_quiz() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Load the sample quiz questions once and share them between demos
+    
+    Returns:
+        Tuple of read-only question mappings
+    """
+    with open(SAMPLE_QUIZ_FILE, 'rb') as f:
+        questions = _loads(f.read())
+    
+    return tuple(
+        MappingProxyType({
+            **question,
+            'options': tuple(question['options']),
+            'category': sys.intern(question['category'])
+        })
+        for question in questions
+    )
+
+# Built once at import; the read-only mappings are safe to share between demos
+SAMPLE_STUDENT_ANSWERS = (
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[0],
+        'name': 'John Doe',
+        'email': 'john.doe@email.com',
+        'answers': (0, 1, 1)  # Answers to the 3 questions
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[1],
+        'name': 'Jane Smith',
+        'email': 'jane.smith@email.com',
+        'answers': (0, 1, 0)
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[2],
+        'name': 'Bob Johnson',
+        'email': 'bob.johnson@email.com',
+        'answers': (1, 0, 1)
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[3],
+        'name': 'Alice Brown',
+        'email': 'alice.brown@email.com',
+        'answers': (0, 1, 1)
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[4],
+        'name': 'Charlie Wilson',
+        'email': 'charlie.wilson@email.com',
+        'answers': (0, 0, 0)
+    })
+)
+
+SAMPLE_VIDEO_DATA = (
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[0],
+        'video_path': '/path/to/john_doe_interview.mp4'
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[1],
+        'video_path': '/path/to/jane_smith_interview.mp4'
+    }),
+    MappingProxyType({
+        'student_id': _STUDENT_IDS[2],
+        'video_path': '/path/to/bob_johnson_interview.mp4'
+    })
+)
@@ -7,11 +7,11 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 # Import agents
-from agents.quiz_manager import QuizManagerAgent
-from agents.checker import CheckerAgent
-from agents.shortlist_agent import ShortlistAgent
-from agents.video_analyzer_agent import VideoAnalyzerAgent
-from agents.finalizer import FinalizerAgent
+from agents.quiz_manager import QuizManagerAgent, QUIZ_QUESTION_HEADERS
+from agents.checker import CheckerAgent, QUIZ_RESULTS_HEADERS
+from agents.shortlist_agent import ShortlistAgent, SHORTLIST_HEADERS
+from agents.video_analyzer_agent import VideoAnalyzerAgent, VIDEO_ANALYSIS_HEADERS
+from agents.finalizer import FinalizerAgent, FINAL_SELECTION_HEADERS
 
 # Import tools
 from tools.sheets_manager import SheetsManager
@@ -19,7 +19,6 @@ from tools.email_manager import EmailManager
 from tools.video_analyzer import VideoAnalyzer
 
 # Import configuration
-from config import Config
 
 class StudentSelectionCrew:
     def __init__(self, credentials_file: str, sheet_id: str, 
@@ -51,14 +50,24 @@ class StudentSelectionCrew:
     def _initialize_sheets(self):
         """Initialize all required Google Sheets"""
         try:
+            # Write every sheet's header row in one request
+            self.sheets_manager.batch_write([
+                ('Quiz_Questions!A1', [QUIZ_QUESTION_HEADERS]),
+                ('Quiz_Results!A1', [QUIZ_RESULTS_HEADERS]),
+                ('Shortlist_Results!A1', [SHORTLIST_HEADERS]),
+                ('Video_Analysis!A1', [VIDEO_ANALYSIS_HEADERS]),
+                ('Final_Selection!A1', [FINAL_SELECTION_HEADERS])
+            ])
+            print("All sheets initialized successfully")
+        except Exception as e:
+            # One missing sheet fails the whole batch; fall back to isolated
+            # per-sheet writes so the sheets that exist still get their headers
+            print(f"⚠️ Batched header write failed, initializing sheets one by one: {e}")
             self.quiz_manager.initialize_quiz_sheet()
             self.checker.initialize_results_sheet()
             self.shortlist_agent.initialize_shortlist_sheet()
             self.video_analyzer_agent.initialize_video_analysis_sheet()
             self.finalizer.initialize_final_selection_sheet()
-            print("All sheets initialized successfully")
-        except Exception as e:
-            print(f"Error initializing sheets: {e}")
     
     def create_quiz_questions(self, questions_data: List[Dict[str, Any]]) -> bool:
         """
@@ -144,12 +153,15 @@ class StudentSelectionCrew:
         
         return shortlisted
     
-    def analyze_video_interviews(self, video_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def analyze_video_interviews(self, video_data: List[Dict[str, Any]],
+                                 student_index: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Analyze video interviews
         
         Args:
             video_data: List of video data dictionaries with 'student_id', 'video_path'
+            student_index: Optional mapping of student_id to student data, used
+                to attach each student's name and email to their result
         
         Returns:
             List of analysis results
@@ -159,6 +171,13 @@ class StudentSelectionCrew:
         # Analyze videos
         results = self.video_analyzer_agent.analyze_videos(video_data)
         
+        if student_index:
+            for result in results:
+                student = student_index.get(result['student_id'])
+                if student:
+                    result.setdefault('student_name', student.get('name', ''))
+                    result.setdefault('email', student.get('email', ''))
+        
         # Store results
         if results:
             self.video_analyzer_agent.store_video_analysis_results(results)
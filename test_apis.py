@@ -2,26 +2,23 @@
 Test script to verify API configuration
 """
 import os
-from dotenv import load_dotenv
+from config import CONFIG
 
 def test_api_configuration():
     """Test if all required APIs are configured"""
     print("=== API CONFIGURATION TEST ===")
     print("Testing your API setup...")
     
-    # Load environment variables
-    load_dotenv()
-    
     # Test each API key
     apis = {
-        "OpenAI API": os.getenv('OPENAI_API_KEY'),
-        "Google API": os.getenv('GOOGLE_API_KEY'),
-        "Gemini API": os.getenv('GEMINI_API_KEY'),
-        "AssemblyAI API": os.getenv('ASSEMBLYAI_API_KEY'),
-        "Gmail Username": os.getenv('GMAIL_USERNAME'),
-        "Gmail App Password": os.getenv('GMAIL_APP_PASSWORD'),
-        "Google Sheet ID": os.getenv('GOOGLE_SHEET_ID'),
-        "Google Credentials File": os.getenv('GOOGLE_CREDENTIALS_FILE')
+        "OpenAI API": CONFIG.OPENAI_API_KEY,
+        "Google API": CONFIG.GOOGLE_API_KEY,
+        "Gemini API": CONFIG.GEMINI_API_KEY,
+        "AssemblyAI API": CONFIG.ASSEMBLYAI_API_KEY,
+        "Gmail Username": CONFIG.GMAIL_USERNAME,
+        "Gmail App Password": CONFIG.GMAIL_APP_PASSWORD,
+        "Google Sheet ID": CONFIG.GOOGLE_SHEET_ID,
+        "Google Credentials File": CONFIG.GOOGLE_CREDENTIALS_FILE
     }
     
     print("\n--- API Status ---")
@@ -55,8 +52,8 @@ def test_google_sheet_connection():
         from tools.sheets_manager import SheetsManager
         
         # Check if credentials file exists
-        credentials_file = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
-        sheet_id = os.getenv('GOOGLE_SHEET_ID')
+        credentials_file = CONFIG.GOOGLE_CREDENTIALS_FILE
+        sheet_id = CONFIG.GOOGLE_SHEET_ID
         
         if not os.path.exists(credentials_file):
             print(f"✗ Credentials file not found: {credentials_file}")
@@ -94,8 +91,8 @@ def test_email_configuration():
     try:
         from tools.email_manager import EmailManager
         
-        gmail_username = os.getenv('GMAIL_USERNAME')
-        gmail_password = os.getenv('GMAIL_APP_PASSWORD')
+        gmail_username = CONFIG.GMAIL_USERNAME
+        gmail_password = CONFIG.GMAIL_APP_PASSWORD
         
         if not gmail_username or not gmail_password:
             print("✗ Gmail credentials not configured")
@@ -2,20 +2,21 @@
 Test the fixed Student Selection Crew system
 """
 from fixed_student_selection_crew import FixedStudentSelectionCrew
-from config import Config
+from config import get_config
 
 def test_complete_workflow():
     """Test the complete workflow with the fixed system"""
+    cfg = get_config()
     print("🚀 TESTING FIXED STUDENT SELECTION CREW")
     print("=" * 50)
     
     try:
         # Initialize the fixed crew
         crew = FixedStudentSelectionCrew(
-            credentials_file=Config.GOOGLE_CREDENTIALS_FILE,
-            sheet_id=Config.GOOGLE_SHEET_ID,
-            gmail_username=Config.GMAIL_USERNAME,
-            gmail_password=Config.GMAIL_APP_PASSWORD
+            credentials_file=cfg.GOOGLE_CREDENTIALS_FILE,
+            sheet_id=cfg.GOOGLE_SHEET_ID,
+            gmail_username=cfg.GMAIL_USERNAME,
+            gmail_password=cfg.GMAIL_APP_PASSWORD
         )
         print("✅ Fixed crew initialized successfully!")
         
@@ -10,7 +10,7 @@ def test_imports():
     print("Testing imports...")
     
     try:
-        from config import Config
+        from config import get_config
         print("✓ Config imported successfully")
     except ImportError as e:
         print(f"✗ Config import failed: {e}")
@@ -86,10 +86,11 @@ def test_config():
     print("\nTesting configuration...")
     
     try:
-        from config import Config
-        print(f"✓ Project name: {Config.PROJECT_NAME}")
-        print(f"✓ Max shortlist: {Config.MAX_SHORTLIST}")
-        print(f"✓ Max final selection: {Config.MAX_FINAL_SELECTION}")
+        from config import get_config
+        cfg = get_config()
+        print(f"✓ Project name: {cfg.PROJECT_NAME}")
+        print(f"✓ Max shortlist: {cfg.MAX_SHORTLIST}")
+        print(f"✓ Max final selection: {cfg.MAX_FINAL_SELECTION}")
         return True
     except Exception as e:
         print(f"✗ Config test failed: {e}")
@@ -2,20 +2,21 @@
 Test the system with real data in your Google Sheet
 """
 from student_selection_crew import StudentSelectionCrew
-from config import Config
+from config import get_config
 
 def test_with_sample_data():
     """Test the system with sample data"""
+    cfg = get_config()
     print("🧪 TESTING WITH SAMPLE DATA")
     print("=" * 40)
     
     try:
         # Initialize the crew
         crew = StudentSelectionCrew(
-            credentials_file=Config.GOOGLE_CREDENTIALS_FILE,
-            sheet_id=Config.GOOGLE_SHEET_ID,
-            gmail_username=Config.GMAIL_USERNAME,
-            gmail_password=Config.GMAIL_APP_PASSWORD
+            credentials_file=cfg.GOOGLE_CREDENTIALS_FILE,
+            sheet_id=cfg.GOOGLE_SHEET_ID,
+            gmail_username=cfg.GMAIL_USERNAME,
+            gmail_password=cfg.GMAIL_APP_PASSWORD
         )
         print("✅ Crew initialized successfully!")
         
@@ -0,0 +1,83 @@
+"""
+On-disk cache of video analysis results keyed by video content
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'student_crew', 'video')
+
+# Cached analyses older than this are analyzed again
+CACHE_TTL = 30 * 24 * 3600
+
+# Videos are hashed in blocks of this size to bound memory use
+_BLOCK_BYTES = 1 << 20
+
+def video_key(video_path: str) -> Optional[str]:
+    """
+    Build a cache key from the full content of a video
+
+    The whole file is hashed: recordings from the same camera can share their
+    headers and length, and a collision would give one student another's scores.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Cache key, or None if the file cannot be read
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(video_path, 'rb') as f:
+            for block in iter(lambda: f.read(_BLOCK_BYTES), b''):
+                digest.update(block)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return None
+    return f"{digest.hexdigest()}-{size}"
+
+def _cache_path(key: str) -> str:
+    """Location of the cached analysis for a key"""
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached analysis result
+
+    Args:
+        key: Key from video_key
+
+    Returns:
+        Cached analysis result, or None if missing or expired
+    """
+    path = _cache_path(key)
+    try:
+        if time.time() - os.stat(path).st_mtime > CACHE_TTL:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def put(key: str, result: Dict[str, Any]) -> None:
+    """
+    Store an analysis result
+
+    Args:
+        key: Key from video_key
+        result: Analysis result to cache
+    """
+    path = _cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # Cached results hold interview transcripts; keep them private to the user
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"⚠️ Could not cache video analysis: {e}")
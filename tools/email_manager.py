@@ -2,12 +2,26 @@
 Email management tool for sending notifications
 """
 import smtplib
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from string import Template
 from typing import List, Dict
 import os
+from config import get_config
+
+_SHORTLIST_SUBJECT = "Congratulations! You've been shortlisted"
+_FINAL_SELECTION_SUBJECT = "Congratulations! You've been selected"
+
+# Email bodies compiled once from the configured templates
+_SHORTLIST_TEMPLATE = Template(get_config().SHORTLIST_EMAIL_TEMPLATE)
+_FINAL_SELECTION_BODY = Template(get_config().FINAL_SELECTION_EMAIL_TEMPLATE).substitute()
 
 class EmailManager:
+    # SMTP sends are I/O bound, so a small thread pool overlaps the round-trips;
+    # kept low because Gmail throttles concurrent logins from one account
+    MAX_WORKERS = 2
+    
     def __init__(self, username: str, password: str):
         """
         Initialize email manager
@@ -20,6 +34,18 @@ class EmailManager:
         self.password = password
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 587
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                            thread_name_prefix='email')
+    
+    def close(self) -> None:
+        """Wait for queued emails to finish sending and shut down the worker pool"""
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self) -> 'EmailManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def send_email(self, to_email: str, subject: str, body: str) -> bool:
         """
@@ -64,17 +90,26 @@ class EmailManager:
         Returns:
             Dict mapping email addresses to success status
         """
-        results = {}
+        futures = [
+            (recipient['email'], self.enqueue(recipient['email'], recipient['subject'], recipient['body']))
+            for recipient in recipients
+        ]
         
-        for recipient in recipients:
-            email = recipient['email']
-            subject = recipient['subject']
-            body = recipient['body']
-            
-            success = self.send_email(email, subject, body)
-            results[email] = success
+        return {email: future.result() for email, future in futures}
+    
+    def enqueue(self, to_email: str, subject: str, body: str) -> Future:
+        """
+        Send an email on the background worker pool
         
-        return results
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body
+        
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._executor.submit(self.send_email, to_email, subject, body)
     
     def send_shortlist_notification(self, email: str, drive_link: str, deadline: str) -> bool:
         """
@@ -88,25 +123,9 @@ class EmailManager:
         Returns:
             True if successful
         """
-        subject = "Congratulations! You've been shortlisted"
-        body = f"""
-Congratulations! You have been shortlisted for the next round.
-
-Please upload a 1-minute video interview at the following link:
-{drive_link}
-
-The video should cover:
-- Your background and experience
-- Why you're interested in AI/ML
-- Your current education status
-
-Deadline: {deadline}
-
-Best regards,
-Student Selection Team
-        """
+        body = _SHORTLIST_TEMPLATE.substitute(drive_link=drive_link, deadline=deadline)
         
-        return self.send_email(email, subject, body)
+        return self.send_email(email, _SHORTLIST_SUBJECT, body)
     
     def send_final_selection_notification(self, email: str) -> bool:
         """
@@ -118,16 +137,32 @@ Student Selection Team
         Returns:
             True if successful
         """
-        subject = "Congratulations! You've been selected"
-        body = """
-Congratulations! You have been selected for the final round.
-
-We were impressed by your video interview and would like to proceed with the next steps.
-
-Please check your email for further instructions.
-
-Best regards,
-Student Selection Team
+        return self.send_email(email, _FINAL_SELECTION_SUBJECT, _FINAL_SELECTION_BODY)
+    
+    def enqueue_shortlist_notification(self, email: str, drive_link: str, deadline: str) -> Future:
+        """
+        Queue a shortlist notification email
+        
+        Args:
+            email: Recipient email
+            drive_link: Google Drive link for video upload
+            deadline: Submission deadline
+        
+        Returns:
+            Future resolving to True if successful
+        """
+        body = _SHORTLIST_TEMPLATE.substitute(drive_link=drive_link, deadline=deadline)
+        
+        return self.enqueue(email, _SHORTLIST_SUBJECT, body)
+    
+    def enqueue_final_selection_notification(self, email: str) -> Future:
         """
+        Queue a final selection notification email
         
-        return self.send_email(email, subject, body)
+        Args:
+            email: Recipient email
+        
+        Returns:
+            Future resolving to True if successful
+        """
+        return self.enqueue(email, _FINAL_SELECTION_SUBJECT, _FINAL_SELECTION_BODY)
@@ -0,0 +1,54 @@
+"""
+Record of sheet header rows that were recently verified
+"""
+import hashlib
+import os
+import time
+from typing import List
+from config import BASE_DIR, get_config
+
+# Verified headers are checked against the sheet again after this many seconds,
+# so headers cleared or edited by hand are repaired on a later run
+HEADER_CACHE_TTL = 24 * 3600
+
+def headers_fingerprint(sheet_id: str, headers: List[str]) -> str:
+    """Fingerprint of the expected headers for a given sheet"""
+    return hashlib.blake2b(repr((sheet_id, list(headers))).encode(), digest_size=16).hexdigest()
+
+def _marker_path(fingerprint: str) -> str:
+    """Location of the marker for a fingerprint, under the repo's temp directory"""
+    return os.path.join(BASE_DIR, get_config().TEMP_DIR, f"sheet_headers_{fingerprint}.digest")
+
+def headers_verified(sheet_id: str, headers: List[str]) -> bool:
+    """
+    Check whether the sheet's headers were verified within HEADER_CACHE_TTL
+
+    Args:
+        sheet_id: Google Sheets document ID
+        headers: Expected header row
+
+    Returns:
+        True if the header read can be skipped
+    """
+    try:
+        verified_at = os.stat(_marker_path(headers_fingerprint(sheet_id, headers))).st_mtime
+    except OSError:
+        return False
+    return time.time() - verified_at < HEADER_CACHE_TTL
+
+def mark_headers_verified(sheet_id: str, headers: List[str]) -> None:
+    """
+    Remember that the sheet has the expected headers
+
+    Args:
+        sheet_id: Google Sheets document ID
+        headers: Header row found in or written to the sheet
+    """
+    path = _marker_path(headers_fingerprint(sheet_id, headers))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w'):
+            pass
+        os.utime(path)
+    except OSError as e:
+        print(f"⚠️ Could not cache sheet headers: {e}")
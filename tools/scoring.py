@@ -0,0 +1,130 @@
+"""
+Vectorized quiz scoring helpers
+"""
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple
+import numpy as np
+
+# Answer matrix codes: UNANSWERED past the end of a student's answer list, and
+# INVALID_ANSWER for a given answer that is not an option index. Invalid answers
+# still count towards the maximum possible score but can never be correct.
+UNANSWERED = -1
+INVALID_ANSWER = -2
+_MAX_ANSWER = np.iinfo(np.int32).max
+
+def answer_key(quiz_questions: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split the quiz questions into correct-answer and points arrays
+    
+    Args:
+        quiz_questions: List of quiz questions with correct answers
+    
+    Returns:
+        Tuple of (correct answers, points), one entry per question
+    """
+    n_questions = len(quiz_questions)
+    correct = np.fromiter((q['correct_answer'] for q in quiz_questions),
+                          dtype=np.int32, count=n_questions)
+    points = points_array([q['points'] for q in quiz_questions])
+    return correct, points
+
+def points_array(points: Any) -> np.ndarray:
+    """
+    Convert question points to an array without overflow or truncation
+    
+    Args:
+        points: Points per question
+    
+    Returns:
+        int64 array, or float64 if any question has fractional points
+    """
+    points = np.asarray(points)
+    if points.dtype.kind == 'f' and np.any(np.mod(points, 1) != 0):
+        return points
+    return points.astype(np.int64)
+
+@dataclass(frozen=True)
+class QuizAnswerKey:
+    """Answer key of a quiz stored as one array per field"""
+    correct: np.ndarray
+    points: np.ndarray
+    categories: Tuple[str, ...]
+    
+    @classmethod
+    def from_questions(cls, quiz_questions: List[Dict[str, Any]]) -> 'QuizAnswerKey':
+        """
+        Build the answer key from quiz question dictionaries
+        
+        Args:
+            quiz_questions: List of quiz questions with correct answers
+        
+        Returns:
+            QuizAnswerKey for the questions, in order
+        """
+        correct, points = answer_key(quiz_questions)
+        return cls(correct, points, tuple(q.get('category', '') for q in quiz_questions))
+    
+    def __len__(self) -> int:
+        return len(self.correct)
+
+def _answer_code(answer: Any) -> int:
+    """Matrix code for one given answer; anything but a non-negative integer is invalid"""
+    if isinstance(answer, (int, np.integer)) or (isinstance(answer, float) and answer.is_integer()):
+        answer = int(answer)
+        if 0 <= answer <= _MAX_ANSWER:
+            return answer
+    return INVALID_ANSWER
+
+def answer_matrix(student_answers: List[Dict[str, Any]], n_questions: int) -> np.ndarray:
+    """
+    Stack student answers into a [students, questions] matrix
+    
+    Args:
+        student_answers: List of student answer dictionaries
+        n_questions: Number of questions in the quiz
+    
+    Returns:
+        Answer matrix; questions past the end of a student's answers are
+        UNANSWERED, and answers that are not option indexes (None, strings,
+        negative numbers) are INVALID_ANSWER
+    """
+    answers = np.full((len(student_answers), n_questions), UNANSWERED, dtype=np.int32)
+    for i, student in enumerate(student_answers):
+        row = student.get('answers', [])[:n_questions]
+        answers[i, :len(row)] = [_answer_code(answer) for answer in row]
+    return answers
+
+def score_submissions(student_answers: List[Dict[str, Any]],
+                      quiz_questions: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Score all submissions against the answer key in one vectorized pass
+    
+    Args:
+        student_answers: List of student answer dictionaries
+        quiz_questions: List of quiz questions with correct answers
+    
+    Returns:
+        Array with the total score of each student, in input order
+    """
+    correct, points = answer_key(quiz_questions)
+    answers = answer_matrix(student_answers, len(quiz_questions))
+    
+    return ((answers == correct).astype(np.int64) * points).sum(axis=1)
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores without a full sort
+    
+    Args:
+        scores: Score per student
+        k: Number of students to keep
+    
+    Returns:
+        Indices into scores, highest score first
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind='stable')]
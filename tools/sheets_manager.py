@@ -4,10 +4,37 @@ Google Sheets management tool for storing and retrieving data
 import pandas as pd
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
-from typing import List, Dict, Any
+from itertools import islice, product
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import os
+import time
+
+# Cell values read back as a true boolean flag: every casing of 'true',
+# matching the previous value.lower() == 'true' checks
+TRUE_VALUES = frozenset(map(''.join, product(*zip('true', 'TRUE'))))
+
+def to_int(value: Any, default: int = 0) -> int:
+    """Parse a sheet cell as an int, returning default for blank or malformed cells"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def to_float(value: Any, default: float = 0) -> float:
+    """Parse a sheet cell as a float, returning default for blank or malformed cells"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def pad_row(row: List[str], width: int) -> List[str]:
+    """Right-pad a sheet row with blanks (the API drops trailing empty cells)"""
+    return (row + [''] * width)[:width]
 
 class SheetsManager:
+    # Seconds a memoized read stays valid; edits made outside this process show up after this
+    READ_CACHE_TTL = 30
+    
     def __init__(self, credentials_file: str, sheet_id: str):
         """
         Initialize Google Sheets manager
@@ -19,6 +46,9 @@ class SheetsManager:
         self.credentials_file = credentials_file
         self.sheet_id = sheet_id
         self.service = self._build_service()
+        # Memoized reads keyed on (sheet_name, range_name) -> (read time, rows);
+        # entries of a sheet are dropped whenever this manager writes to it
+        self._read_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[List[str]]]] = {}
     
     def _build_service(self):
         """Build Google Sheets service"""
@@ -28,17 +58,27 @@ class SheetsManager:
         )
         return build('sheets', 'v4', credentials=creds)
     
-    def read_sheet(self, sheet_name: str, range_name: str = None) -> List[List[str]]:
+    def read_sheet(self, sheet_name: str, range_name: str = None,
+                   copy: bool = True) -> List[List[str]]:
         """
         Read data from Google Sheets
         
         Args:
             sheet_name: Name of the sheet
             range_name: Range to read (e.g., 'A1:Z100')
+            copy: Return rows the caller may modify. With copy=False the memoized
+                rows object itself is returned; it must be treated as read-only,
+                and stays the same object until the cached read expires or the
+                sheet is written
         
         Returns:
             List of rows from the sheet
         """
+        key = (sheet_name, range_name)
+        cached = self._read_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.READ_CACHE_TTL:
+            return [list(row) for row in cached[1]] if copy else cached[1]
+        
         if range_name:
             range_to_read = f"{sheet_name}!{range_name}"
         else:
@@ -49,7 +89,23 @@ class SheetsManager:
             range=range_to_read
         ).execute()
         
-        return result.get('values', [])
+        values = result.get('values', [])
+        self._read_cache[key] = (time.monotonic(), values)
+        return [list(row) for row in values] if copy else values
+    
+    def invalidate(self, sheet_name: str = None) -> None:
+        """
+        Drop memoized reads so the next read hits the API
+        
+        Args:
+            sheet_name: Only drop reads of this sheet (default: all sheets)
+        """
+        if sheet_name is None:
+            self._read_cache.clear()
+            return
+        
+        for key in [key for key in self._read_cache if key[0] == sheet_name]:
+            del self._read_cache[key]
     
     def write_sheet(self, sheet_name: str, data: List[List[str]], 
                    start_cell: str = 'A1') -> None:
@@ -70,6 +126,40 @@ class SheetsManager:
             valueInputOption='RAW',
             body=body
         ).execute()
+        self.invalidate(sheet_name)
+    
+    def write_rows_chunked(self, sheet_name: str, rows: Iterable[List[Any]],
+                           start_row: int = 1, chunk_size: int = 500) -> int:
+        """
+        Write rows from an iterable in fixed-size chunks, one API call per chunk
+        
+        Args:
+            sheet_name: Name of the sheet
+            rows: Rows to write, e.g. a generator; never materialized in full
+            start_row: Sheet row of the first written row
+            chunk_size: Maximum rows per API call
+        
+        Returns:
+            Number of rows written
+        """
+        rows = iter(rows)
+        written = 0
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    return written
+                
+                self.service.spreadsheets().values().update(
+                    spreadsheetId=self.sheet_id,
+                    range=f"{sheet_name}!A{start_row + written}",
+                    valueInputOption='RAW',
+                    body={'values': chunk}
+                ).execute()
+                written += len(chunk)
+        finally:
+            if written:
+                self.invalidate(sheet_name)
     
     def append_to_sheet(self, sheet_name: str, data: List[List[str]]) -> None:
         """
@@ -89,6 +179,7 @@ class SheetsManager:
             insertDataOption='INSERT_ROWS',
             body=body
         ).execute()
+        self.invalidate(sheet_name)
     
     def update_cell(self, sheet_name: str, cell: str, value: str) -> None:
         """
@@ -108,3 +199,39 @@ class SheetsManager:
             valueInputOption='RAW',
             body=body
         ).execute()
+        self.invalidate(sheet_name)
+    
+    def batch_update(self, sheet_name: str, updates: List[Tuple[str, List[List[Any]]]]) -> None:
+        """
+        Write several ranges of one sheet in a single API request
+        
+        Args:
+            sheet_name: Name of the sheet
+            updates: List of (range, rows) pairs (e.g., ('D2:D10', [['Shortlisted'], ...]))
+        """
+        self.batch_write([(f"{sheet_name}!{range_name}", values) for range_name, values in updates])
+    
+    def batch_write(self, updates: List[Tuple[str, List[List[Any]]]]) -> None:
+        """
+        Write ranges of any number of sheets in a single API request
+        
+        Args:
+            updates: List of (sheet range, rows) pairs (e.g., ('Quiz_Results!A1', [headers]))
+        """
+        if not updates:
+            return
+        
+        body = {
+            'valueInputOption': 'RAW',
+            'data': [
+                {'range': range_name, 'values': values}
+                for range_name, values in updates
+            ]
+        }
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.sheet_id,
+            body=body
+        ).execute()
+        
+        for sheet_name in {range_name.split('!', 1)[0] for range_name, _ in updates}:
+            self.invalidate(sheet_name)
@@ -3,10 +3,11 @@ Video analysis tools for speech-to-text and content analysis
 """
 import os
 import tempfile
+import threading
 from typing import Dict, Any, List
 import whisper
 import google.generativeai as genai
-from config import Config
+from config import get_config
 
 class VideoAnalyzer:
     def __init__(self, gemini_api_key: str = None):
@@ -16,10 +17,13 @@ class VideoAnalyzer:
         Args:
             gemini_api_key: Google Gemini API key
         """
-        self.gemini_api_key = gemini_api_key or Config.GEMINI_API_KEY
+        self.gemini_api_key = gemini_api_key or get_config().GEMINI_API_KEY
         
         # Initialize Whisper model
         self.whisper_model = whisper.load_model("base")
+        # Whisper installs hooks on the shared model while decoding, so only one
+        # transcription runs at a time; audio extraction and Gemini calls overlap
+        self._whisper_lock = threading.Lock()
         
         # Initialize Gemini
         if self.gemini_api_key:
@@ -78,7 +82,8 @@ class VideoAnalyzer:
                 return None
             
             # Transcribe using Whisper
-            result = self.whisper_model.transcribe(audio_path)
+            with self._whisper_lock:
+                result = self.whisper_model.transcribe(audio_path)
             transcript = result["text"]
             
             # Clean up temporary audio file